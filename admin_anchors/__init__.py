@@ -1,3 +1,17 @@
 from admin_anchors.decorators import admin_anchor
+from admin_anchors.mixins import AdminAnchorsMixin
+from admin_anchors.rendering import (
+    aiter_render_anchors,
+    arender_anchors,
+    iter_render_anchors,
+    render_anchors,
+)
 
-__all__ = ["admin_anchor"]
+__all__ = [
+    "AdminAnchorsMixin",
+    "admin_anchor",
+    "aiter_render_anchors",
+    "arender_anchors",
+    "iter_render_anchors",
+    "render_anchors",
+]
@@ -0,0 +1,602 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from django.contrib import admin
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
+from django.db import models, router
+from django.utils.html import conditional_escape
+
+from admin_anchors.caching import (
+    get_anchor_cache,
+    get_cache_key,
+    get_cache_version,
+    track_models,
+)
+from admin_anchors.counters import register_counter_cache
+from admin_anchors.expressions import (
+    capped_related_count,
+    related_count,
+    related_exists,
+)
+from admin_anchors.instrumentation import (
+    AnchorStatsCollector,
+    get_anchor_stats_collector,
+)
+from admin_anchors.utils import (
+    CappedCount,
+    create_admin_anchor,
+    create_admin_change_anchor,
+    create_admin_url,
+    create_lazy_anchor_placeholder,
+    get_admin_change_path,
+)
+
+
+@dataclass(frozen=True)
+class AnchorPath:
+    model: type[models.Model]
+    parent_path: tuple[str, ...]
+    field_name: str
+    field: models.Field | models.ForeignObjectRel
+    related_model: type[models.Model] | None
+    many: bool
+    query_key: str
+    attname: str | None
+    parent_lookup: str
+    value_lookup: str
+    resolves_locally: bool
+    select_related: str | None
+    prefetch_related: str | None
+    dependencies: tuple[type[models.Model], ...]
+    content_type_attname: str | None = None
+
+    @property
+    def generic(self) -> bool:
+        return self.content_type_attname is not None
+
+
+def is_generic_foreign_key(field: Any) -> bool:
+    if not field.is_relation or field.related_model is not None:
+        return False
+
+    from django.contrib.contenttypes.fields import GenericForeignKey
+
+    return isinstance(field, GenericForeignKey)
+
+
+def compile_generic_anchor_path(model: type[models.Model], field: Any) -> AnchorPath:
+    object_id_field = model._meta.get_field(field.fk_field)
+    return AnchorPath(
+        model=model,
+        parent_path=(),
+        field_name=field.name,
+        field=field,
+        related_model=None,
+        many=False,
+        query_key="pk",
+        attname=object_id_field.attname,
+        parent_lookup="pk",
+        value_lookup=object_id_field.name,
+        resolves_locally=True,
+        select_related=None,
+        prefetch_related=field.name,
+        dependencies=(model,),
+        content_type_attname=model._meta.get_field(field.ct_field).attname,
+    )
+
+
+def compile_anchor_path(
+    model: type[models.Model], field_path: tuple[str, ...]
+) -> AnchorPath:
+    *parent_path, field_name = field_path
+    current_model = model
+    dependencies = [model]
+
+    for index, hop_name in enumerate(field_path):
+        field = current_model._meta.get_field(hop_name)
+
+        if is_generic_foreign_key(field) and len(field_path) == 1:
+            return compile_generic_anchor_path(model, field)
+        if is_generic_foreign_key(field):
+            raise ImproperlyConfigured(
+                f"Generic foreign keys must be the only field of a path: {field}"
+            )
+        if field.related_model is None:
+            raise ImproperlyConfigured(f"Non-relation field referenced: {field}")
+
+        if index < len(parent_path) and (field.one_to_many or field.many_to_many):
+            raise ImproperlyConfigured(
+                f"To-many relation referenced before the end of the path: {field}"
+            )
+
+        current_model = field.related_model
+        dependencies.append(current_model)
+
+        if isinstance(field, models.ManyToManyField):
+            dependencies.append(field.remote_field.through)
+        elif isinstance(field, models.ManyToManyRel):
+            dependencies.append(field.through)
+
+    attname = None
+
+    if isinstance(field, models.ForeignKey):
+        many = False
+        target_field = field.target_field
+        query_key = "pk" if target_field.primary_key else target_field.name
+        attname = field.attname
+    elif isinstance(field, models.OneToOneRel):
+        many = False
+        query_key = "pk"
+    elif isinstance(field, (models.ManyToOneRel, models.ManyToManyRel)):
+        many = True
+        query_key = f"{field.field.name}__pk"
+    elif isinstance(field, models.ManyToManyField):
+        many = True
+        query_key = f"{field.related_query_name()}__pk"
+    else:
+        raise ImproperlyConfigured(
+            f"Unsupported field type: {field}"
+        )  # pragma: no cover
+
+    parent_lookup = "__".join((*parent_path, "pk"))
+
+    if many:
+        select_related = "__".join(parent_path) or None
+        prefetch_related = "__".join(field_path)
+    else:
+        select_related = "__".join(field_path)
+        prefetch_related = None
+
+    return AnchorPath(
+        model=model,
+        parent_path=tuple(parent_path),
+        field_name=field_name,
+        field=field,
+        related_model=field.related_model,
+        many=many,
+        query_key=query_key,
+        attname=attname,
+        parent_lookup=parent_lookup,
+        value_lookup=parent_lookup if many else "__".join(field_path),
+        resolves_locally=not parent_path and (many or attname is not None),
+        select_related=select_related,
+        prefetch_related=prefetch_related,
+        dependencies=tuple(dict.fromkeys(dependencies)),
+    )
+
+
+@dataclass(frozen=True)
+class AnchorLink:
+    app_label: str
+    model_name: str
+    query: dict[str, Any]
+    label: str
+    site_name: str = "admin"
+    object_id: Any = None
+
+    @property
+    def url(self) -> str:
+        if self.object_id is not None:
+            return get_admin_change_path(
+                site_name=self.site_name,
+                app_label=self.app_label,
+                model_name=self.model_name,
+                object_id=self.object_id,
+            )
+
+        return create_admin_url(
+            app_label=self.app_label,
+            model_name=self.model_name,
+            query=self.query,
+            site_name=self.site_name,
+        )
+
+    def as_html(self) -> str:
+        if self.object_id is not None:
+            return create_admin_change_anchor(
+                app_label=self.app_label,
+                model_name=self.model_name,
+                label=self.label,
+                object_id=self.object_id,
+                site_name=self.site_name,
+            )
+
+        return create_admin_anchor(
+            app_label=self.app_label,
+            model_name=self.model_name,
+            label=self.label,
+            query=self.query,
+            site_name=self.site_name,
+        )
+
+
+def get_anchor_values(instance: models.Model) -> dict["Anchor", Any]:
+    return instance.__dict__.setdefault("_anchor_values", {})
+
+
+def get_anchor_links(instance: models.Model) -> dict["Anchor", Any]:
+    return instance.__dict__.setdefault("_anchor_links", {})
+
+
+def get_anchor_cache_keys(instance: models.Model) -> dict["Anchor", str]:
+    return instance.__dict__.setdefault("_anchor_cache_keys", {})
+
+
+def get_anchor_permissions(instance: models.Model) -> dict["Anchor", bool]:
+    return instance.__dict__.setdefault("_anchor_permissions", {})
+
+
+class Anchor:
+    def __init__(
+        self,
+        dotted_field_path: str,
+        label_func: Callable[..., str],
+        *,
+        count: bool = False,
+        count_limit: int | None = None,
+        count_field: str | None = None,
+        filter: dict[str, Any] | None = None,
+        pk_only: bool = False,
+        hide_empty: bool = False,
+        change_view: bool = False,
+        lazy: bool = False,
+        sortable: bool = False,
+        cache: bool = False,
+        cache_timeout: float | None = DEFAULT_TIMEOUT,
+        cache_version_field: str | None = None,
+    ):
+        self.dotted_field_path = dotted_field_path
+        self.field_path = tuple(dotted_field_path.split("."))
+        self.label_func = label_func
+        self.count = count or count_limit is not None or count_field is not None
+        self.count_limit = count_limit
+        self.count_field = count_field
+        self.filter = dict(filter or {})
+        self.pk_only = pk_only
+        self.hide_empty = hide_empty
+        self.change_view = change_view
+        self.lazy = lazy
+        self.sortable = sortable
+        self.cache = cache
+        self.cache_timeout = cache_timeout
+        self.cache_version_field = cache_version_field
+        self.count_annotation = count_field or f"anchor_{label_func.__name__}_count"
+        self.exists_annotation = f"anchor_{label_func.__name__}_exists"
+        self._paths: dict[type[models.Model], AnchorPath] = {}
+
+    def __repr__(self) -> str:
+        return f"<Anchor {self.label_func.__qualname__} {self.dotted_field_path!r}>"
+
+    def compile(self, model: type[models.Model]) -> AnchorPath:
+        try:
+            return self._paths[model]
+        except KeyError:
+            path = compile_anchor_path(model, self.field_path)
+
+        if self.count and not path.many:
+            raise ImproperlyConfigured(
+                f"Counting requires a to-many relation: {path.field}"
+            )
+
+        if self.change_view and (path.many or path.query_key != "pk"):
+            raise ImproperlyConfigured(
+                f"Linking to the change view requires a relation to the primary "
+                f"key of a single object: {path.field}"
+            )
+
+        if self.filter and (not path.many or self.count_field):
+            raise ImproperlyConfigured(
+                f"Filters require a to-many relation without a counter field: "
+                f"{path.field}"
+            )
+
+        if self.sortable and path.generic:
+            raise ImproperlyConfigured(
+                f"Generic foreign keys cannot be sorted by: {path.field}"
+            )
+
+        if self.count_field:
+            register_counter_cache(path, self.count_field)
+
+        if self.cache:
+            track_models(path.dependencies)
+
+        self._paths[model] = path
+        return path
+
+    def get_related_lookups(
+        self, model: type[models.Model]
+    ) -> tuple[str | None, str | None]:
+        path = self.compile(model)
+
+        if self.pk_only:
+            return None, None
+
+        prefetch_related = None if self.count else path.prefetch_related
+        return path.select_related, prefetch_related
+
+    def get_count_expression(self, path: AnchorPath) -> models.Expression:
+        if self.count_limit is not None:
+            return capped_related_count(path, self.count_limit, self.filter)
+
+        return related_count(path, self.filter)
+
+    @property
+    def counts_in_batch(self) -> bool:
+        return bool(self.filter) and self.count and self.count_limit is None
+
+    def get_annotations(self, model: type[models.Model]) -> dict[str, Any]:
+        path = self.compile(model)
+        annotations = {}
+
+        if self.cache:
+            # Cached links are counted per page, for cache misses only.
+            return annotations
+
+        if self.count and not self.count_field and not self.counts_in_batch:
+            annotations[self.count_annotation] = self.get_count_expression(path)
+        elif self.hide_empty and path.many and not self.count:
+            annotations[self.exists_annotation] = related_exists(path, self.filter)
+
+        return annotations
+
+    def get_order_expression(self, model: type[models.Model]) -> models.Expression:
+        path = self.compile(model)
+
+        if self.count_field:
+            return models.F(self.count_field)
+        if path.many:
+            return self.get_count_expression(path)
+
+        return models.F("__".join((*self.field_path, "pk")))
+
+    def get_count(self, path: AnchorPath, instance: models.Model, query: dict) -> int:
+        count = getattr(instance, self.count_annotation, None)
+
+        if count is None:
+            using = router.db_for_read(path.related_model, instance=instance)
+            queryset = path.related_model._default_manager.using(using).filter(**query)
+
+            if self.filter:
+                queryset = queryset.distinct()
+            if self.count_limit is not None:
+                queryset = queryset.order_by()[: self.count_limit + 1]
+
+            count = queryset.count()
+
+        if self.count_limit is not None:
+            return CappedCount(count, self.count_limit)
+
+        return count
+
+    def get_exists(self, path: AnchorPath, instance: models.Model, query: dict) -> bool:
+        exists = getattr(instance, self.exists_annotation, None)
+
+        if exists is None:
+            using = router.db_for_read(path.related_model, instance=instance)
+            exists = (
+                path.related_model._default_manager.using(using)
+                .filter(**query)
+                .exists()
+            )
+
+        return exists
+
+    def resolve_parent(
+        self, path: AnchorPath, instance: models.Model
+    ) -> models.Model | None:
+        parent = instance
+
+        for field_name in path.parent_path:
+            try:
+                parent = getattr(parent, field_name)
+            except ObjectDoesNotExist:
+                return None
+
+            if parent is None:
+                return None
+
+        return parent
+
+    def resolve_query_value(self, path: AnchorPath, instance: models.Model) -> Any:
+        anchor_values = instance.__dict__.get("_anchor_values")
+
+        if anchor_values is not None and self in anchor_values:
+            return anchor_values[self]
+
+        parent = self.resolve_parent(path, instance)
+
+        if parent is None:
+            return None
+        if path.many:
+            return parent.pk
+        if path.attname:
+            return getattr(parent, path.attname)
+
+        field_value = getattr(parent, path.field_name, None)
+        return None if field_value is None else field_value.pk
+
+    def get_related_model(
+        self, path: AnchorPath, instance: models.Model
+    ) -> type[models.Model] | None:
+        if not path.generic:
+            return path.related_model
+
+        content_type_id = getattr(instance, path.content_type_attname)
+
+        if content_type_id is None:
+            return None
+
+        content_type = path.field.get_content_type(
+            id=content_type_id, using=instance._state.db
+        )
+        return content_type.model_class()
+
+    def get_link(
+        self, model_admin: admin.ModelAdmin, instance: models.Model
+    ) -> AnchorLink | None:
+        collector = get_anchor_stats_collector()
+
+        if collector is None:
+            return self.get_cached_link(model_admin, instance)
+
+        collector.start(self)
+
+        try:
+            return self.get_cached_link(model_admin, instance, collector)
+        finally:
+            collector.stop()
+
+    def get_cached_link(
+        self,
+        model_admin: admin.ModelAdmin,
+        instance: models.Model,
+        collector: AnchorStatsCollector | None = None,
+    ) -> AnchorLink | None:
+        if not self.cache or instance is None:
+            return self.build_link(model_admin, instance, collector)
+
+        anchor_links = instance.__dict__.get("_anchor_links")
+
+        if anchor_links is not None and self in anchor_links:
+            return anchor_links[self] or None
+
+        cache = get_anchor_cache()
+        cache_keys = instance.__dict__.get("_anchor_cache_keys")
+        prefetched = cache_keys is not None and self in cache_keys
+
+        if prefetched:
+            # A known cache miss of prefetch_cached_links().
+            key, link = cache_keys.pop(self), None
+        else:
+            path = self.compile(type(instance))
+            site_name = model_admin.admin_site.name if model_admin else "admin"
+            key = get_cache_key(self, path, site_name, instance)
+            link = cache.get(key)
+
+        if link is None:
+            link = self.build_link(model_admin, instance, collector)
+            cache.set(key, link or False, self.cache_timeout)
+
+        if prefetched:
+            get_anchor_links(instance)[self] = link or False
+
+        return link or None
+
+    def prefetch_cached_links(
+        self, model_admin: admin.ModelAdmin, instances: list[models.Model]
+    ) -> list[models.Model]:
+        if not instances:
+            return []
+
+        path = self.compile(type(instances[0]))
+        site_name = model_admin.admin_site.name
+        # Generation versions are shared by all instances of the page.
+        version = (
+            None
+            if self.cache_version_field
+            else get_cache_version(self, path, instances[0])
+        )
+        keys = {
+            get_cache_key(self, path, site_name, instance, version): instance
+            for instance in instances
+        }
+        links = get_anchor_cache().get_many(keys)
+        misses = []
+
+        for key, instance in keys.items():
+            if key in links:
+                get_anchor_links(instance)[self] = links[key]
+            else:
+                get_anchor_cache_keys(instance)[self] = key
+                misses.append(instance)
+
+        return misses
+
+    def build_link(
+        self,
+        model_admin: admin.ModelAdmin,
+        instance: models.Model,
+        collector: AnchorStatsCollector | None = None,
+    ) -> AnchorLink | None:
+        if instance is None:
+            return None
+
+        path = self.compile(type(instance))
+        query_value = self.resolve_query_value(path, instance)
+        related_model = self.get_related_model(path, instance)
+
+        if query_value is None or related_model is None:
+            return None
+
+        query = {path.query_key: query_value, **self.filter}
+
+        if self.count:
+            count = self.get_count(path, instance, query)
+            is_empty = not count
+        elif self.hide_empty and path.many:
+            is_empty = not self.get_exists(path, instance, query)
+        else:
+            is_empty = False
+
+        if self.hide_empty and is_empty:
+            return None
+
+        if collector is not None:
+            collector.enter_phase("label")
+
+        if self.count:
+            label = self.label_func(model_admin, instance, count)
+        else:
+            label = self.label_func(model_admin, instance)
+
+        return AnchorLink(
+            app_label=related_model._meta.app_label,
+            model_name=related_model._meta.model_name,
+            query=query,
+            label=label,
+            site_name=model_admin.admin_site.name if model_admin else "admin",
+            object_id=query_value if self.change_view else None,
+        )
+
+    def render(self, model_admin: admin.ModelAdmin, instance: models.Model) -> str:
+        if self.lazy and instance is not None:
+            return create_lazy_anchor_placeholder(
+                app_label=model_admin.opts.app_label,
+                model_name=model_admin.opts.model_name,
+                anchor_name=self.label_func.__name__,
+                object_id=instance.pk,
+                site_name=model_admin.admin_site.name,
+            )
+
+        return self.render_link(
+            model_admin, instance, self.get_link(model_admin, instance)
+        )
+
+    def render_link(
+        self,
+        model_admin: admin.ModelAdmin,
+        instance: models.Model,
+        link: AnchorLink | None,
+    ) -> str:
+        if link is None:
+            return model_admin.get_empty_value_display()
+
+        anchor_permissions = instance.__dict__.get("_anchor_permissions")
+
+        if anchor_permissions is not None and not anchor_permissions.get(self, True):
+            return conditional_escape(link.label)
+
+        collector = get_anchor_stats_collector()
+
+        if collector is None:
+            return link.as_html()
+
+        collector.start(self, "html", cell=False)
+
+        try:
+            return link.as_html()
+        finally:
+            collector.stop()
@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+
+
+class AdminAnchorsConfig(AppConfig):
+    name = "admin_anchors"
+    verbose_name = "Admin anchors"
+
+    def ready(self):
+        from admin_anchors.registry import connect_anchor_counters
+
+        # Admins are autodiscovered by django.contrib.admin, which must be
+        # listed before admin_anchors in INSTALLED_APPS.
+        connect_anchor_counters()
@@ -0,0 +1,81 @@
+import hashlib
+import time
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, BaseCache, caches
+from django.db import models
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+if TYPE_CHECKING:
+    from admin_anchors.anchors import Anchor, AnchorPath
+
+
+def get_anchor_cache() -> BaseCache:
+    return caches[getattr(settings, "ADMIN_ANCHORS_CACHE", DEFAULT_CACHE_ALIAS)]
+
+
+def get_generation_key(model: type[models.Model]) -> str:
+    return f"admin_anchors:generation:{model._meta.label_lower}"
+
+
+def bump_generation(model: type[models.Model]) -> None:
+    cache = get_anchor_cache()
+    key = get_generation_key(model)
+
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def _bump_sender_generation(sender: type[models.Model], **kwargs) -> None:
+    bump_generation(sender)
+
+
+def track_models(model_classes: tuple[type[models.Model], ...]) -> None:
+    for model in model_classes:
+        dispatch_uid = f"admin_anchors:{model._meta.label_lower}"
+
+        for signal in (post_save, post_delete, m2m_changed):
+            signal.connect(
+                _bump_sender_generation, sender=model, dispatch_uid=dispatch_uid
+            )
+
+
+def get_cache_version(
+    anchor: "Anchor", path: "AnchorPath", instance: models.Model
+) -> str:
+    if anchor.cache_version_field:
+        return str(getattr(instance, anchor.cache_version_field))
+
+    cache = get_anchor_cache()
+    keys = [get_generation_key(model) for model in path.dependencies]
+    generations = cache.get_many(keys)
+
+    for key in keys:
+        if key not in generations:
+            cache.add(key, time.time_ns(), timeout=None)
+            generations[key] = cache.get(key)
+
+    return ".".join(str(generations[key]) for key in keys)
+
+
+def get_cache_key(
+    anchor: "Anchor",
+    path: "AnchorPath",
+    site_name: str,
+    instance: models.Model,
+    version: str | None = None,
+) -> str:
+    func = anchor.label_func
+    anchor_id = (
+        f"{func.__module__}.{func.__qualname__}:{anchor.dotted_field_path}:"
+        f"{path.model._meta.label_lower}:{site_name}"
+    )
+    digest = hashlib.md5(anchor_id.encode(), usedforsecurity=False).hexdigest()
+
+    if version is None:
+        version = get_cache_version(anchor, path, instance)
+
+    return f"admin_anchors:anchor:{digest}:{instance.pk}:{version}"
@@ -0,0 +1,205 @@
+from django.apps import apps
+from django.conf import settings
+from django.core import checks
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import models
+from django.http import HttpRequest
+
+from admin_anchors.anchors import Anchor, AnchorPath
+from admin_anchors.mixins import AdminAnchorsMixin
+from admin_anchors.registry import RegisteredAnchor, iter_admin_anchors
+
+
+def is_strict() -> bool:
+    return getattr(settings, "ADMIN_ANCHORS_STRICT_CHECKS", False)
+
+
+def warning(
+    msg: str, hint: str, obj: type, warning_id: str, error_id: str
+) -> checks.CheckMessage:
+    if is_strict():
+        return checks.Error(msg, hint=hint, obj=obj, id=f"admin_anchors.{error_id}")
+
+    return checks.Warning(msg, hint=hint, obj=obj, id=f"admin_anchors.{warning_id}")
+
+
+def get_changelist_queryset(model_admin) -> models.QuerySet:
+    return model_admin.get_queryset(HttpRequest())
+
+
+def is_list_select_related(model_admin, lookup: str) -> bool:
+    list_select_related = model_admin.list_select_related
+
+    if list_select_related is True:
+        return True
+    if not list_select_related:
+        return False
+
+    return any(
+        related == lookup or related.startswith(f"{lookup}__")
+        for related in list_select_related
+    )
+
+
+def is_select_related(queryset: models.QuerySet, lookup: str) -> bool:
+    select_related = queryset.query.select_related
+
+    if select_related is True:
+        return True
+    if not select_related:
+        return False
+
+    for hop_name in lookup.split("__"):
+        if hop_name not in select_related:
+            return False
+
+        select_related = select_related[hop_name]
+
+    return True
+
+
+def is_prefetched(queryset: models.QuerySet, lookup: str) -> bool:
+    return any(
+        getattr(prefetch, "prefetch_through", prefetch) == lookup
+        for prefetch in queryset._prefetch_related_lookups
+    )
+
+
+def check_anchor_queries(
+    registered: RegisteredAnchor,
+    anchor: Anchor,
+    path: AnchorPath,
+    queryset: models.QuerySet,
+) -> list[checks.CheckMessage]:
+    model_admin = registered.model_admin
+    obj = type(model_admin)
+    name = f"{obj.__qualname__}.{registered.name}"
+    errors = []
+
+    if anchor.lazy or (anchor.pk_only and isinstance(model_admin, AdminAnchorsMixin)):
+        return errors
+
+    lookup = None if path.resolves_locally else path.select_related
+
+    if lookup and not (
+        is_list_select_related(model_admin, lookup)
+        or is_select_related(queryset, lookup)
+        or is_prefetched(queryset, lookup)
+    ):
+        errors.append(
+            warning(
+                f"{name} follows '{lookup}', which is neither selected nor "
+                f"prefetched by the changelist queryset.",
+                hint=f"Add '{lookup}' to list_select_related or use AdminAnchorsMixin.",
+                obj=obj,
+                warning_id="W001",
+                error_id="E002",
+            )
+        )
+
+    if (anchor.counts_in_batch or anchor.cache) and isinstance(
+        model_admin, AdminAnchorsMixin
+    ):
+        annotation = None
+    elif anchor.count and not anchor.count_field:
+        annotation = anchor.count_annotation
+    elif anchor.hide_empty and path.many:
+        annotation = anchor.exists_annotation
+    else:
+        annotation = None
+
+    if annotation and annotation not in queryset.query.annotations:
+        errors.append(
+            warning(
+                f"{name} runs a query per row because the changelist queryset "
+                f"is not annotated with '{annotation}'.",
+                hint="Use AdminAnchorsMixin to annotate the changelist queryset.",
+                obj=obj,
+                warning_id="W002",
+                error_id="E003",
+            )
+        )
+
+    return errors
+
+
+@checks.register(checks.Tags.admin)
+def check_anchors(app_configs=None, **kwargs) -> list[checks.CheckMessage]:
+    errors = []
+    querysets = {}
+
+    for registered in iter_admin_anchors():
+        model_admin = registered.model_admin
+        anchor = registered.anchor
+
+        if app_configs is not None and model_admin.opts.app_config not in app_configs:
+            continue
+
+        try:
+            path = anchor.compile(model_admin.model)
+        except (FieldDoesNotExist, ImproperlyConfigured) as error:
+            errors.append(
+                checks.Error(
+                    f"{type(model_admin).__qualname__}.{registered.name} has an "
+                    f"invalid path '{anchor.dotted_field_path}': {error}",
+                    obj=type(model_admin),
+                    id="admin_anchors.E001",
+                )
+            )
+            continue
+
+        if anchor.lazy and not isinstance(model_admin, AdminAnchorsMixin):
+            errors.append(
+                checks.Error(
+                    f"{type(model_admin).__qualname__}.{registered.name} is lazy, "
+                    f"but lazy anchors are served by AdminAnchorsMixin.",
+                    hint="Add AdminAnchorsMixin to the model admin.",
+                    obj=type(model_admin),
+                    id="admin_anchors.E004",
+                )
+            )
+
+        if registered.name not in model_admin.list_display:
+            continue
+
+        if model_admin not in querysets:
+            try:
+                querysets[model_admin] = get_changelist_queryset(model_admin)
+            except Exception as error:
+                querysets[model_admin] = None
+                errors.append(
+                    checks.Warning(
+                        f"{type(model_admin).__qualname__} could not build the "
+                        f"changelist queryset: {error}",
+                        hint="Its anchors are not checked for extra queries.",
+                        obj=type(model_admin),
+                        id="admin_anchors.W003",
+                    )
+                )
+
+        if querysets[model_admin] is not None:
+            errors.extend(
+                check_anchor_queries(registered, anchor, path, querysets[model_admin])
+            )
+
+    return errors
+
+
+@checks.register()
+def check_installed_apps(app_configs=None, **kwargs) -> list[checks.CheckMessage]:
+    names = [app_config.name for app_config in apps.get_app_configs()]
+
+    if "django.contrib.admin" in names and names.index("admin_anchors") < names.index(
+        "django.contrib.admin"
+    ):
+        return [
+            checks.Error(
+                "'admin_anchors' is listed before 'django.contrib.admin' in "
+                "INSTALLED_APPS, so the counter fields of autodiscovered model "
+                "admins are not kept up to date.",
+                hint="List 'admin_anchors' after 'django.contrib.admin'.",
+                id="admin_anchors.E005",
+            )
+        ]
+
+    return []
@@ -0,0 +1,181 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+
+from admin_anchors.expressions import related_count
+
+if TYPE_CHECKING:
+    from admin_anchors.anchors import AnchorPath
+
+
+@dataclass(frozen=True)
+class CounterCache:
+    path: "AnchorPath"
+    field_name: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.path.model._meta.label}.{self.field_name}"
+
+    def refresh(self, lookup: str = "pk", values: Iterable[Any] | None = None) -> int:
+        queryset = self.path.model._base_manager.all()
+
+        if values is not None:
+            values = {value for value in values if value is not None}
+
+            if not values:
+                return 0
+
+            queryset = queryset.filter(**{f"{lookup}__in": values})
+
+        return queryset.update(**{self.field_name: related_count(self.path)})
+
+
+_counter_caches: dict[tuple[type[models.Model], str], CounterCache] = {}
+
+
+def get_counter_caches() -> list[CounterCache]:
+    return list(_counter_caches.values())
+
+
+def register_counter_cache(path: "AnchorPath", field_name: str) -> CounterCache:
+    if path.parent_path or not path.many:
+        raise ImproperlyConfigured(
+            f"Counter caches require a single to-many relation: {path.field}"
+        )
+
+    field = path.model._meta.get_field(field_name)
+
+    if not isinstance(field, models.IntegerField):
+        raise ImproperlyConfigured(f"Counter cache field is not an integer: {field}")
+
+    key = (path.model, field_name)
+
+    counter = _counter_caches.get(key)
+
+    if counter is not None and counter.path != path:
+        raise ImproperlyConfigured(
+            f"Counter cache field is already used for another path: {field}"
+        )
+    if counter is not None:
+        return counter
+
+    counter = CounterCache(path, field_name)
+
+    if isinstance(path.field, models.ManyToOneRel):
+        connect_foreign_key_counter(counter, path.field.field)
+    else:
+        connect_many_to_many_counter(counter)
+
+    _counter_caches[key] = counter
+    return counter
+
+
+def connect_foreign_key_counter(
+    counter: CounterCache, foreign_key: models.ForeignKey
+) -> None:
+    sender = foreign_key.model
+    lookup = foreign_key.target_field.attname
+    state_key = f"_anchor_counter_{counter.label}"
+    dispatch_uid = f"admin_anchors:counter:{counter.label}"
+
+    def remember_previous_value(instance: models.Model, **kwargs) -> None:
+        if not instance._state.adding:
+            instance.__dict__[state_key] = (
+                sender._base_manager.filter(pk=instance.pk)
+                .values_list(foreign_key.attname, flat=True)
+                .first()
+            )
+
+    def refresh_after_save(instance: models.Model, **kwargs) -> None:
+        previous_value = instance.__dict__.pop(state_key, None)
+        current_value = getattr(instance, foreign_key.attname)
+
+        if previous_value != current_value or kwargs["created"]:
+            counter.refresh(lookup, [previous_value, current_value])
+
+    def refresh_after_delete(instance: models.Model, **kwargs) -> None:
+        counter.refresh(lookup, [getattr(instance, foreign_key.attname)])
+
+    pre_save.connect(
+        remember_previous_value, sender=sender, weak=False, dispatch_uid=dispatch_uid
+    )
+    post_save.connect(
+        refresh_after_save, sender=sender, weak=False, dispatch_uid=dispatch_uid
+    )
+    post_delete.connect(
+        refresh_after_delete, sender=sender, weak=False, dispatch_uid=dispatch_uid
+    )
+
+
+def connect_many_to_many_counter(counter: CounterCache) -> None:
+    path = counter.path
+
+    if isinstance(path.field, models.ManyToManyField):
+        many_to_many = path.field
+        source_name = many_to_many.m2m_field_name()
+        target_name = many_to_many.m2m_reverse_field_name()
+    else:
+        many_to_many = path.field.field
+        source_name = many_to_many.m2m_reverse_field_name()
+        target_name = many_to_many.m2m_field_name()
+
+    through = many_to_many.remote_field.through
+    source_attname = through._meta.get_field(source_name).attname
+    target_attname = through._meta.get_field(target_name).attname
+    state_key = f"_anchor_counter_{counter.label}"
+    dispatch_uid = f"admin_anchors:counter:{counter.label}"
+
+    def get_source_pks(target_pk: Any) -> list[Any]:
+        return list(
+            through._base_manager.filter(**{target_attname: target_pk}).values_list(
+                source_attname, flat=True
+            )
+        )
+
+    def refresh_after_change(
+        instance: models.Model, action: str, pk_set: set | None, **kwargs
+    ) -> None:
+        if isinstance(instance, path.model):
+            if action in ("post_add", "post_remove", "post_clear"):
+                counter.refresh(values=[instance.pk])
+        elif action == "pre_clear":
+            instance.__dict__[state_key] = get_source_pks(instance.pk)
+        elif action == "post_clear":
+            counter.refresh(values=instance.__dict__.pop(state_key, []))
+        elif action in ("post_add", "post_remove"):
+            counter.refresh(values=pk_set)
+
+    # Django deletes the rows of auto-created through models without sending
+    # signals, so deleted targets are tracked through their own signals.
+    def remember_target_sources(instance: models.Model, **kwargs) -> None:
+        instance.__dict__[state_key] = get_source_pks(instance.pk)
+
+    def refresh_after_target_delete(instance: models.Model, **kwargs) -> None:
+        counter.refresh(values=instance.__dict__.pop(state_key, []))
+
+    m2m_changed.connect(
+        refresh_after_change, sender=through, weak=False, dispatch_uid=dispatch_uid
+    )
+    pre_delete.connect(
+        remember_target_sources,
+        sender=path.related_model,
+        weak=False,
+        dispatch_uid=dispatch_uid,
+    )
+    post_delete.connect(
+        refresh_after_target_delete,
+        sender=path.related_model,
+        weak=False,
+        dispatch_uid=dispatch_uid,
+    )
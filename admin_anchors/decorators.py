@@ -1,55 +1,60 @@
+from typing import Any
+
 from django.contrib import admin
-from django.core.exceptions import ImproperlyConfigured
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from django.db import models
 
-from admin_anchors.utils import (
-    create_admin_anchor,
-    resolve_instance_field_path,
-)
-
-
-def admin_anchor(dotted_field_path: str):
+from admin_anchors import checks  # noqa: F401
+from admin_anchors.anchors import Anchor
+from admin_anchors.expressions import AnchorOrder
+from admin_anchors.registry import register_anchor
+
+
+def admin_anchor(
+    dotted_field_path: str,
+    *,
+    count: bool = False,
+    count_limit: int | None = None,
+    count_field: str | None = None,
+    filter: dict[str, Any] | None = None,
+    pk_only: bool = False,
+    hide_empty: bool = False,
+    change_view: bool = False,
+    lazy: bool = False,
+    sortable: bool = False,
+    cache: bool = False,
+    cache_timeout: float | None = DEFAULT_TIMEOUT,
+    cache_version_field: str | None = None,
+):
     def inner(func):
-        def wrapper(model_admin: admin.ModelAdmin, instance: models.Model) -> str:
-            field_path = dotted_field_path.split(".")
-            field_name = field_path[-1]
-
-            field_parent_path = field_path[:-1]
-            field_parent = resolve_instance_field_path(instance, field_parent_path)
-
-            if field_parent is None:
-                return model_admin.get_empty_value_display()
+        anchor = Anchor(
+            dotted_field_path,
+            func,
+            count=count,
+            count_limit=count_limit,
+            count_field=count_field,
+            filter=filter,
+            pk_only=pk_only,
+            hide_empty=hide_empty,
+            change_view=change_view,
+            lazy=lazy,
+            sortable=sortable,
+            cache=cache,
+            cache_timeout=cache_timeout,
+            cache_version_field=cache_version_field,
+        )
+
+        register_anchor(anchor)
 
-            field = field_parent._meta.get_field(field_name)
-            related_model = field.related_model
-
-            if related_model is None:
-                raise ImproperlyConfigured(f"Non-relation field referenced: {field}")
-
-            field_value = getattr(field_parent, field_name, None)
-
-            if not field_value:
-                return model_admin.get_empty_value_display()
+        def wrapper(model_admin: admin.ModelAdmin, instance: models.Model) -> str:
+            return anchor.render(model_admin, instance)
 
-            if isinstance(field, (models.OneToOneRel, models.ForeignKey)):
-                query = {"pk": field_value.pk}
-            elif isinstance(field, (models.ManyToOneRel, models.ManyToManyRel)):
-                query = {f"{field.field.name}__pk": instance.pk}
-            elif isinstance(field, models.ManyToManyField):
-                query = {f"{field.related_query_name()}__pk": instance.pk}
-            else:
-                raise ImproperlyConfigured(
-                    f"Unsupported field type: {field}"
-                )  # pragma: no cover
+        wrapper.__name__ = func.__name__
+        wrapper.anchor = anchor
 
-            return create_admin_anchor(
-                app_label=related_model._meta.app_label,
-                model_name=related_model._meta.model_name,
-                label=func(model_admin, instance),
-                query=query,
-            )
+        if sortable:
+            wrapper.admin_order_field = AnchorOrder(anchor)
 
-        wrapper.__name__ = func.__name__
         return wrapper
 
     return inner
@@ -0,0 +1,162 @@
+import csv
+import json
+from collections.abc import Iterator
+from typing import Any
+
+from django.apps import apps
+from django.contrib import admin
+from django.contrib.admin.utils import label_for_field, lookup_field
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.http import HttpRequest, StreamingHttpResponse
+from django.utils.encoding import force_str
+from django.utils.text import capfirst
+
+from admin_anchors.anchors import Anchor
+from admin_anchors.rendering import iter_anchor_links
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+class Echo:
+    def write(self, value: str) -> str:
+        return value
+
+
+def get_export_columns(
+    model_admin: admin.ModelAdmin, request: HttpRequest
+) -> list[tuple[str, Anchor | None]]:
+    columns = []
+
+    for field_name in model_admin.get_list_display(request):
+        if field_name == "action_checkbox" or callable(field_name):
+            continue
+
+        attr = getattr(model_admin, field_name, None)
+        columns.append((field_name, getattr(attr, "anchor", None)))
+
+    return columns
+
+
+def get_column_value(
+    model_admin: admin.ModelAdmin, instance: models.Model, field_name: str
+) -> Any:
+    try:
+        _, _, value = lookup_field(field_name, instance, model_admin)
+    except ObjectDoesNotExist:
+        return None
+
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+
+    return force_str(value)
+
+
+def iter_export_rows(
+    model_admin: admin.ModelAdmin,
+    request: HttpRequest,
+    queryset: models.QuerySet,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[dict[str, Any]]:
+    columns = get_export_columns(model_admin, request)
+    anchor_names = [name for name, anchor in columns if anchor is not None]
+    has_permission = getattr(model_admin, "has_related_model_permission", None)
+    links = iter_anchor_links(model_admin, queryset, anchor_names, chunk_size)
+
+    for instance, instance_links in links:
+        row = {}
+
+        for name, anchor in columns:
+            if anchor is None:
+                row[name] = get_column_value(model_admin, instance, name)
+                continue
+
+            link = instance_links[name]
+
+            if link is None:
+                row[name] = {"label": None, "url": None}
+            else:
+                related_model = apps.get_model(link.app_label, link.model_name)
+
+                if has_permission is None or has_permission(request, related_model):
+                    url = request.build_absolute_uri(link.url)
+                else:
+                    url = None
+
+                row[name] = {"label": force_str(link.label), "url": url}
+
+        yield row
+
+
+def iter_csv_export(
+    model_admin: admin.ModelAdmin,
+    request: HttpRequest,
+    queryset: models.QuerySet,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[str]:
+    writer = csv.writer(Echo())
+    header = []
+
+    for name, anchor in get_export_columns(model_admin, request):
+        label = capfirst(label_for_field(name, model_admin.model, model_admin))
+        header.append(label)
+
+        if anchor is not None:
+            header.append(f"{label} URL")
+
+    yield writer.writerow(header)
+
+    for row in iter_export_rows(model_admin, request, queryset, chunk_size):
+        values = []
+
+        for value in row.values():
+            if isinstance(value, dict):
+                values.extend((value["label"], value["url"]))
+            else:
+                values.append(value)
+
+        yield writer.writerow(values)
+
+
+def iter_json_export(
+    model_admin: admin.ModelAdmin,
+    request: HttpRequest,
+    queryset: models.QuerySet,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[str]:
+    separator = "["
+
+    for row in iter_export_rows(model_admin, request, queryset, chunk_size):
+        yield separator + json.dumps(row, cls=DjangoJSONEncoder)
+        separator = ",\n"
+
+    yield "[]" if separator == "[" else "]"
+
+
+def get_export_filename(model_admin: admin.ModelAdmin, extension: str) -> str:
+    return f"{model_admin.opts.model_name}.{extension}"
+
+
+@admin.action(description="Export selected %(verbose_name_plural)s as CSV")
+def export_anchors_csv(
+    model_admin: admin.ModelAdmin, request: HttpRequest, queryset: models.QuerySet
+) -> StreamingHttpResponse:
+    filename = get_export_filename(model_admin, "csv")
+    return StreamingHttpResponse(
+        iter_csv_export(model_admin, request, queryset),
+        content_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@admin.action(description="Export selected %(verbose_name_plural)s as JSON")
+def export_anchors_json(
+    model_admin: admin.ModelAdmin, request: HttpRequest, queryset: models.QuerySet
+) -> StreamingHttpResponse:
+    filename = get_export_filename(model_admin, "json")
+    return StreamingHttpResponse(
+        iter_json_export(model_admin, request, queryset),
+        content_type="application/json",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,100 @@
+from typing import TYPE_CHECKING, Any
+
+from django.db import models
+from django.db.models.expressions import Ref
+from django.db.models.functions import Coalesce
+
+if TYPE_CHECKING:
+    from admin_anchors.anchors import Anchor, AnchorPath
+
+
+def related_queryset(
+    path: "AnchorPath", lookups: dict[str, Any] | None = None
+) -> models.QuerySet:
+    return path.related_model._default_manager.filter(
+        **{path.query_key: models.OuterRef(path.parent_lookup)}, **(lookups or {})
+    )
+
+
+def related_count(
+    path: "AnchorPath", lookups: dict[str, Any] | None = None
+) -> models.Expression:
+    queryset = (
+        related_queryset(path, lookups)
+        .order_by()
+        .values(path.query_key)
+        .annotate(count=models.Count("pk", distinct=bool(lookups)))
+        .values("count")
+    )
+    return Coalesce(models.Subquery(queryset), 0)
+
+
+class CappedCountSubquery(models.Expression):
+    # Oracle rejects AS on derived table aliases, and MariaDB and MySQL before
+    # 8.0.14 reject outer references inside derived tables. These backends
+    # check for an object beyond the limit with EXISTS instead.
+    template = "(SELECT COUNT(*) FROM %(subquery)s AS anchor_capped_count)"
+    output_field = models.IntegerField()
+
+    def __init__(
+        self,
+        queryset: models.QuerySet,
+        limit: int,
+        count: models.Expression,
+    ):
+        super().__init__()
+        self.subquery = models.Subquery(queryset[: limit + 1])
+        self.fallback = models.Case(
+            models.When(models.Exists(queryset[limit:]), then=limit + 1),
+            default=count,
+        )
+
+    def get_source_expressions(self) -> list[models.Expression]:
+        return [self.subquery, self.fallback]
+
+    def set_source_expressions(self, exprs: list[models.Expression]) -> None:
+        self.subquery, self.fallback = exprs
+
+    def as_sql(self, compiler, connection):
+        sql, params = compiler.compile(self.subquery)
+        return self.template % {"subquery": sql}, params
+
+    def as_oracle(self, compiler, connection):
+        return compiler.compile(self.fallback)
+
+    def as_mysql(self, compiler, connection):
+        return compiler.compile(self.fallback)
+
+
+def capped_related_count(
+    path: "AnchorPath", limit: int, lookups: dict[str, Any] | None = None
+) -> models.Expression:
+    queryset = related_queryset(path, lookups).order_by().values("pk")
+
+    if lookups:
+        queryset = queryset.distinct()
+
+    return CappedCountSubquery(queryset, limit, related_count(path, lookups))
+
+
+def related_exists(
+    path: "AnchorPath", lookups: dict[str, Any] | None = None
+) -> models.Expression:
+    return models.Exists(related_queryset(path, lookups))
+
+
+class AnchorOrder(models.Expression):
+    def __init__(self, anchor: "Anchor"):
+        super().__init__()
+        self.anchor = anchor
+
+    def resolve_expression(self, query=None, *args, **kwargs) -> models.Expression:
+        anchor = self.anchor
+
+        if anchor.count and anchor.count_annotation in query.annotations:
+            return Ref(
+                anchor.count_annotation, query.annotations[anchor.count_annotation]
+            )
+
+        expression = anchor.get_order_expression(query.model)
+        return expression.resolve_expression(query, *args, **kwargs)
@@ -0,0 +1,120 @@
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from django.db import connections
+
+from admin_anchors.signals import anchor_stats_collected
+
+if TYPE_CHECKING:
+    from admin_anchors.anchors import Anchor
+
+logger = logging.getLogger("admin_anchors")
+
+_collector: ContextVar["AnchorStatsCollector | None"] = ContextVar(
+    "admin_anchors_collector", default=None
+)
+
+
+@dataclass
+class AnchorStats:
+    anchor: "Anchor"
+    cells: int = 0
+    queries: int = 0
+    resolve_time: float = 0.0
+    label_time: float = 0.0
+    html_time: float = 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.anchor!r}: {self.cells} cells, {self.queries} queries, "
+            f"resolve {self.resolve_time * 1000:.2f} ms, "
+            f"label {self.label_time * 1000:.2f} ms, "
+            f"html {self.html_time * 1000:.2f} ms"
+        )
+
+
+class AnchorStatsCollector:
+    def __init__(self):
+        self.stats: dict[Anchor, AnchorStats] = {}
+        self._active: AnchorStats | None = None
+        self._phase = ""
+        self._phase_started = 0.0
+
+    def start(self, anchor: "Anchor", phase: str = "resolve", cell: bool = True):
+        stats = self.stats.get(anchor)
+
+        if stats is None:
+            stats = self.stats[anchor] = AnchorStats(anchor)
+
+        if cell:
+            stats.cells += 1
+
+        self._active = stats
+        self._phase = phase
+        self._phase_started = time.perf_counter()
+
+    def enter_phase(self, phase: str) -> None:
+        now = time.perf_counter()
+        self._record_phase(now)
+        self._phase = phase
+        self._phase_started = now
+
+    def stop(self) -> None:
+        if self._active is not None:
+            self._record_phase(time.perf_counter())
+            self._active = None
+
+    def _record_phase(self, now: float) -> None:
+        attr = f"{self._phase}_time"
+        elapsed = now - self._phase_started
+        setattr(self._active, attr, getattr(self._active, attr) + elapsed)
+
+    def count_query(self, execute, sql, params, many, context):
+        if self._active is not None:
+            self._active.queries += 1
+
+        return execute(sql, params, many, context)
+
+    def summary(self) -> str:
+        return "\n".join(str(stats) for stats in self.stats.values())
+
+
+def get_anchor_stats_collector() -> AnchorStatsCollector | None:
+    return _collector.get()
+
+
+@contextmanager
+def collect_batch_stats(anchor: "Anchor") -> Iterator[None]:
+    collector = get_anchor_stats_collector()
+
+    if collector is None:
+        yield
+        return
+
+    collector.start(anchor, cell=False)
+
+    try:
+        yield
+    finally:
+        collector.stop()
+
+
+@contextmanager
+def collect_anchor_stats() -> Iterator[AnchorStatsCollector]:
+    collector = AnchorStatsCollector()
+    token = _collector.set(collector)
+
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(collector.count_query))
+            yield collector
+    finally:
+        _collector.reset(token)
+
+    anchor_stats_collected.send(sender=AnchorStatsCollector, collector=collector)
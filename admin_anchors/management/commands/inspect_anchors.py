@@ -0,0 +1,194 @@
+import re
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, models
+
+from admin_anchors.anchors import Anchor, AnchorPath
+from admin_anchors.registry import get_anchors, iter_admin_anchors
+from admin_anchors.resolvers import (
+    counts_queryset,
+    exists_queryset,
+    get_batched_counts,
+    values_queryset,
+)
+
+SCAN_PATTERN = re.compile(r"Seq Scan|TABLE ACCESS FULL|\bSCAN (?!.*\bINDEX\b)")
+
+
+def get_relation_kind(path: AnchorPath) -> str:
+    field = path.field
+
+    if path.generic:
+        return "generic foreign key"
+    if isinstance(field, models.OneToOneField):
+        return "one-to-one"
+    if isinstance(field, models.ForeignKey):
+        return "foreign key"
+    if isinstance(field, models.OneToOneRel):
+        return "reverse one-to-one"
+    if isinstance(field, models.ManyToOneRel):
+        return "reverse foreign key"
+
+    return "many-to-many"
+
+
+def get_filter_field(path: AnchorPath) -> models.Field:
+    field = path.field
+
+    if isinstance(field, models.ForeignKey):
+        return field.target_field
+    if isinstance(field, models.OneToOneRel):
+        return path.related_model._meta.pk
+    if isinstance(field, models.ManyToOneRel):
+        return field.field
+    if isinstance(field, models.ManyToManyField):
+        return field.remote_field.through._meta.get_field(field.m2m_field_name())
+
+    return field.through._meta.get_field(field.field.m2m_reverse_field_name())
+
+
+def is_indexed(field: models.Field) -> bool:
+    if field.primary_key or field.unique or field.db_index:
+        return True
+
+    opts = field.model._meta
+    leading_fields = [
+        *(index.fields[0].lstrip("-") for index in opts.indexes if index.fields),
+        *(fields[0] for fields in opts.unique_together),
+        *(
+            constraint.fields[0]
+            for constraint in opts.constraints
+            if isinstance(constraint, models.UniqueConstraint) and constraint.fields
+        ),
+    ]
+    return field.name in leading_fields
+
+
+def find_scans(plan: str) -> list[str]:
+    return [line.strip() for line in plan.splitlines() if SCAN_PATTERN.search(line)]
+
+
+def get_sample_value(path: AnchorPath, lookup: str, using: str) -> Any:
+    return (
+        path.model._base_manager.using(using)
+        .filter(**{f"{lookup}__isnull": False})
+        .values_list(lookup, flat=True)
+        .first()
+    )
+
+
+def get_anchor_querysets(
+    anchor: Anchor, path: AnchorPath, using: str
+) -> dict[str, models.QuerySet]:
+    query_value = get_sample_value(path, path.value_lookup, using)
+
+    if query_value is None:
+        return {}
+
+    querysets = {
+        "changelist": path.related_model._default_manager.filter(
+            **{path.query_key: query_value}, **anchor.filter
+        )
+    }
+
+    if not path.resolves_locally:
+        pk = get_sample_value(path, "pk", using)
+        querysets["values"] = values_queryset(path.model, [pk], [path.value_lookup])
+    if anchor.count and not anchor.count_field:
+        querysets["counts"] = counts_queryset(
+            path, [query_value], get_batched_counts([anchor])
+        )
+    elif anchor.hide_empty and path.many:
+        querysets["exists"] = exists_queryset(path, [query_value], anchor.filter)
+
+    return {name: queryset.using(using) for name, queryset in querysets.items()}
+
+
+class Command(BaseCommand):
+    help = (
+        "List the admin anchors of all registered model admins and explain "
+        "the queries they run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database to explain the anchor queries on.",
+        )
+        parser.add_argument(
+            "--no-explain",
+            action="store_false",
+            dest="explain",
+            help="Only list the anchors without explaining their queries.",
+        )
+
+    def handle(self, *args, **options):
+        used_anchors = set()
+
+        for registered in iter_admin_anchors():
+            used_anchors.add(registered.anchor)
+            self.inspect_anchor(registered, options["database"], options["explain"])
+
+        for anchor in get_anchors():
+            if anchor not in used_anchors:
+                self.stdout.write(f"{anchor.label_func.__qualname__}")
+                self.stdout.write(f"  path: {anchor.dotted_field_path}")
+                self.stdout.write("  not used by a registered model admin")
+
+    def inspect_anchor(self, registered, using: str, explain: bool) -> None:
+        anchor = registered.anchor
+        model_admin = registered.model_admin
+        self.stdout.write(
+            f"{model_admin.admin_site.name}: {type(model_admin).__qualname__}."
+            f"{registered.name} ({model_admin.opts.label})"
+        )
+
+        try:
+            path = anchor.compile(model_admin.model)
+        except (FieldDoesNotExist, ImproperlyConfigured) as error:
+            self.stdout.write(f"  path: {anchor.dotted_field_path}")
+            self.stdout.write(self.style.ERROR(f"  error: {error}"))
+            return
+
+        if path.generic:
+            self.stdout.write(
+                f"  path: {anchor.dotted_field_path} ({get_relation_kind(path)}) "
+                f"-> {path.field.ct_field}"
+            )
+            self.stdout.write(f"  filter: pk=<{path.value_lookup}>")
+            return
+
+        filter_field = get_filter_field(path)
+        self.stdout.write(
+            f"  path: {anchor.dotted_field_path} ({get_relation_kind(path)}) "
+            f"-> {path.related_model._meta.label}"
+        )
+        self.stdout.write(f"  filter: {path.query_key}=<{path.model._meta.label}>")
+
+        if not is_indexed(filter_field):
+            self.stdout.write(
+                self.style.WARNING(
+                    f"  warning: no index on {filter_field.model._meta.db_table}."
+                    f"{filter_field.column}"
+                )
+            )
+
+        if not explain:
+            return
+
+        querysets = get_anchor_querysets(anchor, path, using)
+
+        if not querysets:
+            self.stdout.write("  explain: skipped, no rows to sample")
+
+        for name, queryset in querysets.items():
+            plan = queryset.explain()
+            self.stdout.write(f"  {name}: {' | '.join(plan.splitlines())}")
+
+            for scan in find_scans(plan):
+                self.stdout.write(
+                    self.style.WARNING(f"  warning: {name} query scans: {scan}")
+                )
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from admin_anchors.counters import get_counter_caches
+
+
+class Command(BaseCommand):
+    help = "Recompute the counter cache fields of admin anchors."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "labels",
+            nargs="*",
+            metavar="app_label.Model.field",
+            help="Only recompute the given counter cache fields.",
+        )
+
+    def handle(self, *labels, **options):
+        labels = set(options["labels"])
+
+        for counter in get_counter_caches():
+            if labels and counter.label not in labels:
+                continue
+
+            updated = counter.refresh()
+            self.stdout.write(f"{counter.label}: {updated} rows updated")
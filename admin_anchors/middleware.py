@@ -0,0 +1,24 @@
+from collections.abc import Callable
+
+from django.http import HttpRequest, HttpResponse
+
+from admin_anchors.instrumentation import collect_anchor_stats, logger
+
+
+class AnchorStatsMiddleware:
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with collect_anchor_stats() as collector:
+            response = self.get_response(request)
+
+        if collector.stats:
+            logger.info(
+                "Admin anchors of %s %s:\n%s",
+                request.method,
+                request.path,
+                collector.summary(),
+            )
+
+        return response
@@ -0,0 +1,241 @@
+from collections.abc import Iterable
+
+from django import forms
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.db import models
+from django.http import HttpRequest, HttpResponseBadRequest, JsonResponse
+from django.urls import path
+
+from admin_anchors.anchors import Anchor, get_anchor_permissions
+from admin_anchors.instrumentation import collect_batch_stats
+from admin_anchors.rendering import iter_render_anchors
+from admin_anchors.resolvers import (
+    group_batched_counts,
+    iter_anchor_queries,
+    resolve_related_counts,
+    resolve_shared_values,
+    run_queries,
+)
+
+LAZY_ANCHORS_MAX_OBJECTS = 1000
+
+
+class AdminAnchorsMixin:
+    def __init__(self, model: type[models.Model], admin_site):
+        super().__init__(model, admin_site)
+        self.has_lazy_anchors = False
+
+        for name in dir(type(self)):
+            anchor = getattr(getattr(type(self), name, None), "anchor", None)
+
+            if anchor is not None and (anchor.cache or anchor.count_field):
+                anchor.compile(model)
+            if anchor is not None and anchor.lazy:
+                self.has_lazy_anchors = True
+
+    @property
+    def media(self) -> forms.Media:
+        media = super().media
+
+        if self.has_lazy_anchors:
+            media += forms.Media(js=["admin_anchors/lazy_anchors.js"])
+
+        return media
+
+    def get_anchors(self, request: HttpRequest) -> list[Anchor]:
+        field_names = [
+            *self.get_list_display(request),
+            *self.get_readonly_fields(request),
+        ]
+        anchors = []
+
+        for field_name in field_names:
+            attr = (
+                field_name if callable(field_name) else getattr(self, field_name, None)
+            )
+            anchor = getattr(attr, "anchor", None)
+
+            if anchor is not None and anchor not in anchors:
+                anchors.append(anchor)
+
+        return anchors
+
+    def get_queryset(self, request: HttpRequest) -> models.QuerySet:
+        queryset = super().get_queryset(request)
+
+        if request.__dict__.get("_lazy_anchors_view"):
+            # The lazy anchors view only loads the requested lazy anchor.
+            return queryset
+
+        return self.annotate_anchors(
+            queryset,
+            [anchor for anchor in self.get_anchors(request) if not anchor.lazy],
+        )
+
+    def annotate_anchors(
+        self, queryset: models.QuerySet, anchors: Iterable[Anchor]
+    ) -> models.QuerySet:
+        select_related = set()
+        prefetch_related = set()
+        annotations = {}
+
+        for anchor in anchors:
+            select_lookup, prefetch_lookup = anchor.get_related_lookups(queryset.model)
+
+            if select_lookup:
+                select_related.add(select_lookup)
+            if prefetch_lookup:
+                prefetch_related.add(prefetch_lookup)
+
+            annotations.update(anchor.get_annotations(queryset.model))
+
+        if select_related:
+            queryset = queryset.select_related(*sorted(select_related))
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*sorted(prefetch_related))
+        if annotations:
+            queryset = queryset.annotate(**annotations)
+
+        return queryset
+
+    def prepare_anchors(
+        self, request: HttpRequest, instances: Iterable[models.Model]
+    ) -> None:
+        instances = [instance for instance in instances if instance is not None]
+        anchors = self.get_anchors(request)
+
+        value_anchors = [
+            anchor for anchor in anchors if anchor.pk_only and not anchor.lazy
+        ]
+
+        if value_anchors:
+            with collect_batch_stats(value_anchors[0]):
+                resolve_shared_values(value_anchors, instances)
+
+        filtered_anchors = [
+            anchor
+            for anchor in anchors
+            if anchor.counts_in_batch and not anchor.cache and not anchor.lazy
+        ]
+
+        for anchors_group in group_batched_counts(
+            filtered_anchors, self.model
+        ).values():
+            with collect_batch_stats(anchors_group[0]):
+                resolve_related_counts(anchors_group, instances)
+
+        for anchor in anchors:
+            if anchor.cache and not anchor.lazy:
+                with collect_batch_stats(anchor):
+                    misses = anchor.prefetch_cached_links(self, instances)
+
+                    if misses:
+                        run_queries(iter_anchor_queries(anchor, misses, {}))
+
+        self.prepare_anchor_permissions(request, anchors, instances)
+
+    def has_related_model_permission(
+        self, request: HttpRequest, related_model: type[models.Model]
+    ) -> bool:
+        key = (self.admin_site.name, related_model)
+        permissions = request.__dict__.setdefault("_anchor_permissions", {})
+
+        if key not in permissions:
+            related_admin = self.admin_site._registry.get(related_model)
+            permissions[key] = (
+                related_admin is not None
+                and related_admin.has_view_or_change_permission(request)
+            )
+
+        return permissions[key]
+
+    def has_anchor_permission(self, request: HttpRequest, anchor: Anchor) -> bool:
+        related_model = anchor.compile(self.model).related_model
+        return self.has_related_model_permission(request, related_model)
+
+    def prepare_anchor_permissions(
+        self,
+        request: HttpRequest,
+        anchors: Iterable[Anchor],
+        instances: Iterable[models.Model],
+    ) -> None:
+        for anchor in anchors:
+            path = anchor.compile(self.model)
+
+            if path.generic:
+                for instance in instances:
+                    related_model = anchor.get_related_model(path, instance)
+
+                    if related_model is not None and not (
+                        self.has_related_model_permission(request, related_model)
+                    ):
+                        get_anchor_permissions(instance)[anchor] = False
+            elif not self.has_anchor_permission(request, anchor):
+                for instance in instances:
+                    get_anchor_permissions(instance)[anchor] = False
+
+    def get_changelist(self, request: HttpRequest, **kwargs):
+        changelist_class = super().get_changelist(request, **kwargs)
+        model_admin = self
+
+        class AnchorChangeList(changelist_class):
+            def get_results(self, request: HttpRequest) -> None:
+                super().get_results(request)
+                model_admin.prepare_anchors(request, self.result_list)
+
+        return AnchorChangeList
+
+    def get_object(self, request: HttpRequest, object_id: str, from_field=None):
+        obj = super().get_object(request, object_id, from_field)
+
+        if obj is not None:
+            self.prepare_anchors(request, [obj])
+
+        return obj
+
+    def get_urls(self):
+        info = self.opts.app_label, self.opts.model_name
+        return [
+            path(
+                "anchors/",
+                self.admin_site.admin_view(self.anchors_view),
+                name="{}_{}_anchors".format(*info),
+            ),
+            *super().get_urls(),
+        ]
+
+    def anchors_view(self, request: HttpRequest) -> JsonResponse:
+        if not self.has_view_or_change_permission(request):
+            raise PermissionDenied
+
+        anchor_name = request.GET.get("anchor", "")
+        anchors = {
+            anchor.label_func.__name__: anchor
+            for anchor in self.get_anchors(request)
+            if anchor.lazy
+        }
+
+        if anchor_name not in anchors:
+            return HttpResponseBadRequest(f"Unknown lazy anchor: {anchor_name}")
+
+        object_ids = request.GET.getlist("pk")[:LAZY_ANCHORS_MAX_OBJECTS]
+        request._lazy_anchors_view = True
+        queryset = self.annotate_anchors(
+            self.get_queryset(request), [anchors[anchor_name]]
+        )
+
+        try:
+            instances = list(queryset.filter(pk__in=object_ids))
+        except (ValidationError, ValueError):
+            return HttpResponseBadRequest("Invalid object ids")
+
+        self.prepare_anchor_permissions(request, [anchors[anchor_name]], instances)
+
+        return JsonResponse(
+            {
+                str(instance.pk): rendered[anchor_name]
+                for instance, rendered in iter_render_anchors(
+                    self, instances, [anchor_name]
+                )
+            }
+        )
@@ -0,0 +1,59 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
+from weakref import WeakSet
+
+from django.contrib import admin
+from django.contrib.admin.sites import all_sites
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+
+from admin_anchors.anchors import Anchor
+
+_anchors: WeakSet[Anchor] = WeakSet()
+
+
+@dataclass(frozen=True)
+class RegisteredAnchor:
+    anchor: Anchor
+    name: str
+    model_admin: admin.ModelAdmin
+
+
+def register_anchor(anchor: Anchor) -> None:
+    _anchors.add(anchor)
+
+
+def get_anchors() -> list[Anchor]:
+    return sorted(
+        _anchors,
+        key=lambda anchor: (
+            anchor.label_func.__module__,
+            anchor.label_func.__qualname__,
+        ),
+    )
+
+
+def iter_admin_anchors() -> Iterator[RegisteredAnchor]:
+    for site in sorted(all_sites, key=lambda site: site.name):
+        model_admins = sorted(
+            site._registry.values(), key=lambda model_admin: model_admin.opts.label
+        )
+
+        for model_admin in model_admins:
+            for name in dir(type(model_admin)):
+                attr = getattr(type(model_admin), name, None)
+                anchor = getattr(attr, "anchor", None)
+
+                if anchor in _anchors:
+                    yield RegisteredAnchor(anchor, name, model_admin)
+
+
+def connect_anchor_counters() -> None:
+    for registered in iter_admin_anchors():
+        if not registered.anchor.count_field:
+            continue
+
+        try:
+            registered.anchor.compile(registered.model_admin.model)
+        except (FieldDoesNotExist, ImproperlyConfigured):
+            # Invalid paths are reported by the system checks.
+            continue
@@ -0,0 +1,140 @@
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from itertools import islice
+
+from django.contrib import admin
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+
+from admin_anchors.anchors import Anchor, AnchorLink
+from admin_anchors.resolvers import aprefetch_anchors, prefetch_anchors
+
+
+def get_anchor(model_admin: admin.ModelAdmin, anchor_name: str) -> Anchor:
+    anchor = getattr(getattr(model_admin, anchor_name, None), "anchor", None)
+
+    if anchor is None:
+        raise ImproperlyConfigured(
+            f"{type(model_admin).__name__}.{anchor_name} is not an admin anchor"
+        )
+
+    return anchor
+
+
+def iter_chunks(
+    instances: Iterable[models.Model], chunk_size: int
+) -> Iterator[list[models.Model]]:
+    if isinstance(instances, models.QuerySet):
+        instances = instances.iterator(chunk_size=chunk_size)
+
+    iterator = iter(instances)
+
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+async def aiter_chunks(
+    instances: Iterable[models.Model], chunk_size: int
+) -> AsyncIterator[list[models.Model]]:
+    if not isinstance(instances, models.QuerySet):
+        for chunk in iter_chunks(instances, chunk_size):
+            yield chunk
+        return
+
+    chunk = []
+
+    async for instance in instances.aiterator(chunk_size=chunk_size):
+        chunk.append(instance)
+
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def iter_anchor_links(
+    model_admin: admin.ModelAdmin,
+    instances: Iterable[models.Model],
+    anchor_names: Sequence[str],
+    chunk_size: int = 500,
+) -> Iterator[tuple[models.Model, dict[str, AnchorLink | None]]]:
+    anchors = {name: get_anchor(model_admin, name) for name in anchor_names}
+
+    for chunk in iter_chunks(instances, chunk_size):
+        prefetch_anchors(anchors.values(), chunk)
+
+        for instance in chunk:
+            yield (
+                instance,
+                {
+                    name: anchor.get_link(model_admin, instance)
+                    for name, anchor in anchors.items()
+                },
+            )
+
+
+def iter_render_anchors(
+    model_admin: admin.ModelAdmin,
+    instances: Iterable[models.Model],
+    anchor_names: Sequence[str],
+    chunk_size: int = 500,
+) -> Iterator[tuple[models.Model, dict[str, str]]]:
+    anchors = {name: get_anchor(model_admin, name) for name in anchor_names}
+    links = iter_anchor_links(model_admin, instances, anchor_names, chunk_size)
+
+    for instance, instance_links in links:
+        yield (
+            instance,
+            {
+                name: anchors[name].render_link(model_admin, instance, link)
+                for name, link in instance_links.items()
+            },
+        )
+
+
+def render_anchors(
+    model_admin: admin.ModelAdmin,
+    instances: Iterable[models.Model],
+    anchor_names: Sequence[str],
+) -> list[dict[str, str]]:
+    return [
+        rendered
+        for _, rendered in iter_render_anchors(model_admin, instances, anchor_names)
+    ]
+
+
+async def aiter_render_anchors(
+    model_admin: admin.ModelAdmin,
+    instances: Iterable[models.Model],
+    anchor_names: Sequence[str],
+    chunk_size: int = 500,
+) -> AsyncIterator[tuple[models.Model, dict[str, str]]]:
+    anchors = {name: get_anchor(model_admin, name) for name in anchor_names}
+
+    async for chunk in aiter_chunks(instances, chunk_size):
+        await aprefetch_anchors(anchors.values(), chunk)
+
+        for instance in chunk:
+            yield (
+                instance,
+                {
+                    name: anchor.render_link(
+                        model_admin, instance, anchor.get_link(model_admin, instance)
+                    )
+                    for name, anchor in anchors.items()
+                },
+            )
+
+
+async def arender_anchors(
+    model_admin: admin.ModelAdmin,
+    instances: Iterable[models.Model],
+    anchor_names: Sequence[str],
+) -> list[dict[str, str]]:
+    return [
+        rendered
+        async for _, rendered in aiter_render_anchors(
+            model_admin, instances, anchor_names
+        )
+    ]
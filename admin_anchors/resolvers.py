@@ -0,0 +1,384 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Generator, Iterable, Sequence
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.db import models, router
+from django.db.models import prefetch_related_objects
+
+try:
+    from django.db.models import aprefetch_related_objects
+except ImportError:  # pragma: no cover, Django < 5.0
+    aprefetch_related_objects = sync_to_async(prefetch_related_objects)
+
+from admin_anchors.anchors import Anchor, AnchorPath, get_anchor_values
+from admin_anchors.instrumentation import collect_batch_stats
+
+
+def values_queryset(
+    model: type[models.Model], pks: Iterable[Any], lookups: Sequence[str]
+) -> models.QuerySet:
+    return model._base_manager.filter(pk__in=pks).values_list("pk", *lookups)
+
+
+def counts_queryset(
+    path: AnchorPath,
+    query_values: Iterable[Any],
+    counts: dict[str, models.Count] | None = None,
+) -> models.QuerySet:
+    return (
+        path.related_model._default_manager.filter(
+            **{f"{path.query_key}__in": query_values}
+        )
+        .order_by()
+        .values_list(path.query_key)
+        .annotate(**(counts or {"count": models.Count("pk")}))
+    )
+
+
+def exists_queryset(
+    path: AnchorPath,
+    query_values: Iterable[Any],
+    lookups: dict[str, Any] | None = None,
+) -> models.QuerySet:
+    return (
+        path.related_model._default_manager.filter(
+            **{f"{path.query_key}__in": query_values}, **(lookups or {})
+        )
+        .order_by()
+        .values_list(path.query_key, flat=True)
+        .distinct()
+    )
+
+
+def run_queries(queries: Generator[models.QuerySet, list, None]) -> None:
+    try:
+        queryset = next(queries)
+
+        while True:
+            queryset = queries.send(list(queryset))
+    except StopIteration:
+        pass
+
+
+async def arun_queries(queries: Generator[models.QuerySet, list, None]) -> None:
+    try:
+        queryset = next(queries)
+
+        while True:
+            queryset = queries.send([row async for row in queryset])
+    except StopIteration:
+        pass
+
+
+def get_value_paths(
+    anchors: Iterable[Anchor], model: type[models.Model]
+) -> dict[Anchor, AnchorPath]:
+    paths = {anchor: anchor.compile(model) for anchor in anchors}
+    return {anchor: path for anchor, path in paths.items() if not path.resolves_locally}
+
+
+def iter_value_queries(
+    anchors: Iterable[Anchor], instances: Iterable[models.Model]
+) -> Generator[models.QuerySet, list, None]:
+    instances = [instance for instance in instances if instance is not None]
+
+    if not instances:
+        return
+
+    model = type(instances[0])
+    paths = get_value_paths(anchors, model)
+    lookups = list(dict.fromkeys(path.value_lookup for path in paths.values()))
+
+    if not lookups:
+        return
+
+    for using, group in group_by_database(model, instances).items():
+        pks = {instance.pk for instance in group}
+        rows = {
+            pk: dict(zip(lookups, values, strict=True))
+            for pk, *values in (yield values_queryset(model, pks, lookups).using(using))
+        }
+
+        for instance in group:
+            row = rows.get(instance.pk, {})
+            anchor_values = get_anchor_values(instance)
+
+            for anchor, path in paths.items():
+                anchor_values[anchor] = row.get(path.value_lookup)
+
+
+def resolve_anchor_values(anchor: Anchor, instances: Iterable[models.Model]) -> None:
+    run_queries(iter_value_queries([anchor], instances))
+
+
+def resolve_shared_values(
+    anchors: Iterable[Anchor], instances: Iterable[models.Model]
+) -> None:
+    run_queries(iter_value_queries(anchors, instances))
+
+
+def group_by_database(
+    model: type[models.Model], instances: Iterable[models.Model]
+) -> dict[str, list[models.Model]]:
+    groups = defaultdict(list)
+
+    for instance in instances:
+        groups[router.db_for_read(model, instance=instance)].append(instance)
+
+    return groups
+
+
+def group_by_query_value(
+    anchor: Anchor, path: AnchorPath, instances: Iterable[models.Model]
+) -> dict[Any, list[models.Model]]:
+    groups = defaultdict(list)
+
+    for instance in instances:
+        query_value = anchor.resolve_query_value(path, instance)
+
+        if query_value is not None:
+            groups[query_value].append(instance)
+
+    return groups
+
+
+def iter_count_queries(
+    anchor: Anchor, instances: Iterable[models.Model]
+) -> Generator[models.QuerySet, list, None]:
+    instances = [
+        instance
+        for instance in instances
+        if instance is not None and not hasattr(instance, anchor.count_annotation)
+    ]
+
+    if not instances:
+        return
+
+    path = anchor.compile(type(instances[0]))
+
+    for using, group in group_by_database(path.model, instances).items():
+        counts = dict(
+            (
+                yield path.model._base_manager.using(using)
+                .filter(pk__in={instance.pk for instance in group})
+                .values_list("pk", anchor.get_count_expression(path))
+            )
+        )
+
+        for instance in group:
+            setattr(instance, anchor.count_annotation, counts[instance.pk])
+
+
+def get_batched_counts(anchors: Iterable[Anchor]) -> dict[str, models.Count]:
+    return {
+        anchor.count_annotation: models.Count(
+            "pk",
+            filter=models.Q(**anchor.filter) if anchor.filter else None,
+            distinct=bool(anchor.filter),
+        )
+        for anchor in anchors
+    }
+
+
+def iter_related_count_queries(
+    anchors: Sequence[Anchor], instances: Iterable[models.Model]
+) -> Generator[models.QuerySet, list, None]:
+    instances = [
+        instance
+        for instance in instances
+        if instance is not None
+        and not all(hasattr(instance, anchor.count_annotation) for anchor in anchors)
+    ]
+
+    if not anchors or not instances:
+        return
+
+    path = anchors[0].compile(type(instances[0]))
+    counts = get_batched_counts(anchors)
+
+    for using, group in group_by_database(path.related_model, instances).items():
+        groups = group_by_query_value(anchors[0], path, group)
+        rows = {
+            query_value: dict(zip(counts, values, strict=True))
+            for query_value, *values in (
+                yield counts_queryset(path, groups, counts).using(using)
+            )
+        }
+
+        for query_value, value_group in groups.items():
+            row = rows.get(query_value, {})
+
+            for instance in value_group:
+                for name in counts:
+                    if not hasattr(instance, name):
+                        setattr(instance, name, row.get(name, 0))
+
+
+def resolve_related_counts(
+    anchors: Sequence[Anchor], instances: Iterable[models.Model]
+) -> None:
+    run_queries(iter_related_count_queries(anchors, instances))
+
+
+def group_batched_counts(
+    anchors: Iterable[Anchor], model: type[models.Model]
+) -> dict[AnchorPath, list[Anchor]]:
+    groups = defaultdict(list)
+
+    for anchor in anchors:
+        if anchor.count and anchor.count_limit is None and not anchor.count_field:
+            groups[anchor.compile(model)].append(anchor)
+
+    return groups
+
+
+def iter_exists_queries(
+    anchor: Anchor, instances: Iterable[models.Model]
+) -> Generator[models.QuerySet, list, None]:
+    instances = [
+        instance
+        for instance in instances
+        if instance is not None and not hasattr(instance, anchor.exists_annotation)
+    ]
+
+    if not instances:
+        return
+
+    path = anchor.compile(type(instances[0]))
+
+    for using, group in group_by_database(path.related_model, instances).items():
+        groups = group_by_query_value(anchor, path, group)
+        existing = set(
+            (yield exists_queryset(path, groups, anchor.filter).using(using))
+        )
+
+        for query_value, value_group in groups.items():
+            for instance in value_group:
+                setattr(instance, anchor.exists_annotation, query_value in existing)
+
+
+def iter_content_type_queries(
+    anchor: Anchor, instances: Iterable[models.Model]
+) -> Generator[models.QuerySet, list, None]:
+    from django.contrib.contenttypes.models import ContentType
+
+    path = anchor.compile(type(instances[0]))
+    content_type_ids = defaultdict(set)
+
+    for instance in instances:
+        content_type_id = getattr(instance, path.content_type_attname)
+        content_type_ids[instance._state.db].add(content_type_id)
+
+    for using, ids in content_type_ids.items():
+        manager = ContentType.objects.db_manager(using)
+
+        for content_type in (yield manager.filter(pk__in=ids)):
+            manager._add_to_cache(using, content_type)
+
+
+def iter_anchor_queries(
+    anchor: Anchor,
+    instances: Sequence[models.Model],
+    batched_counts: dict[Anchor, list[Anchor]],
+    value_anchors: Sequence[Anchor] = (),
+) -> Generator[models.QuerySet, list, None]:
+    if value_anchors and anchor is value_anchors[0]:
+        yield from iter_value_queries(value_anchors, instances)
+
+    if anchor in batched_counts:
+        if anchor is batched_counts[anchor][0]:
+            yield from iter_related_count_queries(batched_counts[anchor], instances)
+    elif anchor.count:
+        yield from iter_count_queries(anchor, instances)
+    elif anchor.hide_empty and anchor.compile(type(instances[0])).many:
+        yield from iter_exists_queries(anchor, instances)
+
+
+def get_related_lookups(
+    anchors: Iterable[Anchor], model: type[models.Model]
+) -> list[str]:
+    lookups = set()
+
+    for anchor in anchors:
+        lookups.update(filter(None, anchor.get_related_lookups(model)))
+
+    return sorted(lookups)
+
+
+def prefetch_anchor_relations(
+    anchors: Iterable[Anchor], instances: Sequence[models.Model]
+) -> None:
+    model = type(instances[0])
+
+    if lookups := get_related_lookups(anchors, model):
+        for group in group_by_database(model, instances).values():
+            prefetch_related_objects(group, *lookups)
+
+
+async def aprefetch_anchor_relations(
+    anchors: Iterable[Anchor], instances: Sequence[models.Model]
+) -> None:
+    model = type(instances[0])
+
+    if lookups := get_related_lookups(anchors, model):
+        for group in group_by_database(model, instances).values():
+            await aprefetch_related_objects(group, *lookups)
+
+
+def get_batched_count_groups(
+    anchors: Sequence[Anchor], model: type[models.Model]
+) -> dict[Anchor, list[Anchor]]:
+    return {
+        anchor: anchors_group
+        for anchors_group in group_batched_counts(anchors, model).values()
+        for anchor in anchors_group
+    }
+
+
+def prefetch_anchors(
+    anchors: Iterable[Anchor], instances: Sequence[models.Model]
+) -> None:
+    instances = [instance for instance in instances if instance is not None]
+
+    if not instances:
+        return
+
+    anchors = list(anchors)
+    model = type(instances[0])
+    batched_counts = get_batched_count_groups(anchors, model)
+    value_anchors = list(get_value_paths(anchors, model))
+    prefetch_anchor_relations(anchors, instances)
+
+    for anchor in anchors:
+        with collect_batch_stats(anchor):
+            run_queries(
+                iter_anchor_queries(anchor, instances, batched_counts, value_anchors)
+            )
+
+
+async def aprefetch_anchors(
+    anchors: Iterable[Anchor], instances: Sequence[models.Model]
+) -> None:
+    instances = [instance for instance in instances if instance is not None]
+
+    if not instances:
+        return
+
+    anchors = list(anchors)
+    model = type(instances[0])
+    batched_counts = get_batched_count_groups(anchors, model)
+    await aprefetch_anchor_relations(anchors, instances)
+    await arun_queries(iter_value_queries(anchors, instances))
+
+    queries = [
+        iter_anchor_queries(anchor, instances, batched_counts) for anchor in anchors
+    ]
+    queries.extend(
+        iter_content_type_queries(anchor, instances)
+        for anchor in anchors
+        if anchor.compile(model).generic
+    )
+
+    await asyncio.gather(*(arun_queries(query) for query in queries))
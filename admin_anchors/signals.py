@@ -0,0 +1,3 @@
+from django.dispatch import Signal
+
+anchor_stats_collected = Signal()
@@ -0,0 +1,59 @@
+"use strict";
+{
+  const BATCH_SIZE = 1000;
+
+  function groupPlaceholders() {
+    const groups = new Map();
+
+    for (const element of document.querySelectorAll("[data-admin-anchor]")) {
+      const { adminAnchor, adminAnchorUrl } = element.dataset;
+      const key = `${adminAnchorUrl}?anchor=${encodeURIComponent(adminAnchor)}`;
+
+      if (!groups.has(key)) {
+        groups.set(key, []);
+      }
+      groups.get(key).push(element);
+    }
+
+    return groups;
+  }
+
+  async function loadGroup(url, elements) {
+    for (let start = 0; start < elements.length; start += BATCH_SIZE) {
+      const batch = elements.slice(start, start + BATCH_SIZE);
+      const query = batch
+        .map((element) => `&pk=${encodeURIComponent(element.dataset.objectId)}`)
+        .join("");
+      const response = await fetch(url + query, {
+        credentials: "same-origin",
+        headers: { Accept: "application/json" },
+      });
+
+      if (!response.ok) {
+        continue;
+      }
+
+      const anchors = await response.json();
+
+      for (const element of batch) {
+        const html = anchors[element.dataset.objectId];
+
+        if (html !== undefined) {
+          element.outerHTML = html;
+        }
+      }
+    }
+  }
+
+  function loadLazyAnchors() {
+    for (const [url, elements] of groupPlaceholders()) {
+      loadGroup(url, elements);
+    }
+  }
+
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", loadLazyAnchors);
+  } else {
+    loadLazyAnchors();
+  }
+}
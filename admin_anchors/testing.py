@@ -0,0 +1,27 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@contextmanager
+def query_budget(
+    max_queries: int, using: str = DEFAULT_DB_ALIAS
+) -> Iterator[CaptureQueriesContext]:
+    with CaptureQueriesContext(connections[using]) as context:
+        yield context
+
+    if len(context) > max_queries:
+        queries = "\n".join(
+            f"{index}. {query['sql']}"
+            for index, query in enumerate(context.captured_queries, start=1)
+        )
+        raise QueryBudgetExceeded(
+            f"{len(context)} queries executed on {using!r}, "
+            f"exceeding the budget of {max_queries}:\n{queries}"
+        )
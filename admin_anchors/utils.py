@@ -1,26 +1,97 @@
+from functools import cache
 from typing import Any
 
+from django.contrib.admin.utils import quote
 from django.core.exceptions import ObjectDoesNotExist
+from django.core.signals import setting_changed
 from django.db import models
-from django.urls import reverse
-from django.utils.html import format_html
+from django.dispatch import receiver
+from django.urls import get_script_prefix, get_urlconf, reverse
+from django.utils.html import conditional_escape, escape, format_html
 from django.utils.http import urlencode
+from django.utils.safestring import mark_safe
+
+
+class CappedCount(int):
+    limit: int
+
+    def __new__(cls, value: int, limit: int):
+        count = super().__new__(cls, min(value, limit + 1))
+        count.limit = limit
+        return count
+
+    @property
+    def capped(self) -> bool:
+        return self > self.limit
+
+    def __str__(self) -> str:
+        return f"{self.limit}+" if self.capped else super().__str__()
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
 
 
 def resolve_instance_field_path(
     instance: models.Model, field_path: list[str]
 ) -> models.Model | None:
-    if not field_path:
-        return instance
+    for field_name in field_path:
+        try:
+            instance = getattr(instance, field_name)
+        except ObjectDoesNotExist:
+            return None
+
+    return instance
+
 
-    field_name = field_path.pop(0)
+OBJECT_ID_PLACEHOLDER = "__object_id__"
 
-    try:
-        next_instance = getattr(instance, field_name)
-    except ObjectDoesNotExist:
-        return None
 
-    return resolve_instance_field_path(next_instance, field_path)
+@cache
+def _reverse_admin_path(
+    viewname: str, urlconf: str | None, script_prefix: str, args: tuple = ()
+) -> str:
+    return reverse(viewname, urlconf=urlconf, args=args)
+
+
+@cache
+def _get_admin_anchor_prefix(path: str) -> str:
+    return format_html("<a href='{}?", path)
+
+
+@receiver(setting_changed)
+def _clear_admin_paths(*, setting: str, **kwargs) -> None:
+    if setting == "ROOT_URLCONF":
+        _reverse_admin_path.cache_clear()
+
+
+def get_admin_path(site_name: str, app_label: str, model_name: str) -> str:
+    viewname = f"{site_name}:{app_label}_{model_name}_changelist"
+    return _reverse_admin_path(viewname, get_urlconf(), get_script_prefix())
+
+
+def get_admin_change_path(
+    site_name: str, app_label: str, model_name: str, object_id: Any
+) -> str:
+    viewname = f"{site_name}:{app_label}_{model_name}_change"
+    path = _reverse_admin_path(
+        viewname, get_urlconf(), get_script_prefix(), (OBJECT_ID_PLACEHOLDER,)
+    )
+    return path.replace(OBJECT_ID_PLACEHOLDER, quote(str(object_id)))
+
+
+def get_admin_anchors_path(site_name: str, app_label: str, model_name: str) -> str:
+    viewname = f"{site_name}:{app_label}_{model_name}_anchors"
+    return _reverse_admin_path(viewname, get_urlconf(), get_script_prefix())
+
+
+def create_admin_url(
+    app_label: str,
+    model_name: str,
+    query: dict[str, Any],
+    site_name: str = "admin",
+) -> str:
+    path = get_admin_path(site_name, app_label, model_name)
+    return f"{path}?{urlencode(query)}"
 
 
 def create_admin_anchor(
@@ -28,8 +99,35 @@ def create_admin_anchor(
     model_name: str,
     label: str,
     query: dict[str, Any],
+    site_name: str = "admin",
+) -> str:
+    prefix = _get_admin_anchor_prefix(get_admin_path(site_name, app_label, model_name))
+    query_string = escape(urlencode(query))
+    return mark_safe(f"{prefix}{query_string}'>{conditional_escape(label)}</a>")
+
+
+def create_admin_change_anchor(
+    app_label: str,
+    model_name: str,
+    label: str,
+    object_id: Any,
+    site_name: str = "admin",
+) -> str:
+    path = get_admin_change_path(site_name, app_label, model_name, object_id)
+    return mark_safe(f"<a href='{escape(path)}'>{conditional_escape(label)}</a>")
+
+
+def create_lazy_anchor_placeholder(
+    app_label: str,
+    model_name: str,
+    anchor_name: str,
+    object_id: Any,
+    site_name: str = "admin",
 ) -> str:
-    path = reverse(f"admin:{app_label}_{model_name}_changelist")
-    query_string = urlencode(query)
-    url = f"{path}?{query_string}"
-    return format_html("<a href='{}'>{}</a>", url, label)
+    return format_html(
+        "<span data-admin-anchor='{}' data-admin-anchor-url='{}' "
+        "data-object-id='{}'>…</span>",
+        anchor_name,
+        get_admin_anchors_path(site_name, app_label, model_name),
+        object_id,
+    )
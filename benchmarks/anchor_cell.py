@@ -0,0 +1,45 @@
+"""Per-cell cost of building an admin anchor.
+
+Run with: python -m benchmarks.anchor_cell
+"""
+
+import os
+import timeit
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.project.project.settings")
+django.setup()
+
+from django.urls import reverse  # noqa: E402
+from django.utils.html import format_html  # noqa: E402
+from django.utils.http import urlencode  # noqa: E402
+
+from admin_anchors.utils import create_admin_anchor  # noqa: E402
+
+NUMBER = 20_000
+
+
+def uncached_admin_anchor(app_label, model_name, label, query):
+    path = reverse(f"admin:{app_label}_{model_name}_changelist")
+    url = f"{path}?{urlencode(query)}"
+    return format_html("<a href='{}'>{}</a>", url, label)
+
+
+def measure(func) -> float:
+    kwargs = {
+        "app_label": "gaming",
+        "model_name": "player",
+        "label": "3 members",
+        "query": {"teams__pk": 42},
+    }
+    func(**kwargs)
+    seconds = min(timeit.repeat(lambda: func(**kwargs), number=NUMBER, repeat=5))
+    return seconds / NUMBER * 1_000_000
+
+
+if __name__ == "__main__":
+    before = measure(uncached_admin_anchor)
+    after = measure(create_admin_anchor)
+    print(f"before: {before:.2f} µs per cell")
+    print(f"after:  {after:.2f} µs per cell ({before / after:.1f}x faster)")
@@ -0,0 +1,37 @@
+import time
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+results = []
+
+
+@pytest.fixture
+def benchmark(request):
+    def run(func, rounds: int = 3) -> tuple[float, int]:
+        timings = []
+
+        for _ in range(rounds):
+            with CaptureQueriesContext(connection) as context:
+                started = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - started)
+
+        results.append((request.node.name, min(timings), len(context)))
+        return min(timings), len(context)
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not results:
+        return
+
+    terminalreporter.section("admin anchor benchmarks")
+    width = max(len(name) for name, _, _ in results)
+
+    for name, seconds, queries in results:
+        terminalreporter.write_line(
+            f"{name:<{width}}  {seconds * 1000:>10.1f} ms  {queries:>4} queries"
+        )
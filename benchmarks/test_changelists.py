@@ -0,0 +1,109 @@
+"""Changelist render time and query counts per anchor type.
+
+Run with: pytest benchmarks --no-cov
+"""
+
+import pytest
+from django.contrib import admin
+
+from admin_anchors import AdminAnchorsMixin, admin_anchor
+from admin_anchors.testing import query_budget
+from tests.project.gaming.models import Player, Profile, Team
+
+ROWS = [100, 1_000, 10_000]
+
+
+class BenchmarkAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+    list_per_page = max(ROWS)
+    list_display = ["__str__", "anchor_link"]
+
+
+class ForeignKeyAdmin(BenchmarkAdmin):
+    @admin_anchor("captain")
+    def anchor_link(self, instance):
+        return str(instance.captain)
+
+
+class PkOnlyForeignKeyAdmin(BenchmarkAdmin):
+    @admin_anchor("captain", pk_only=True)
+    def anchor_link(self, instance):
+        return "Captain"
+
+
+class DeepOneToOneAdmin(BenchmarkAdmin):
+    @admin_anchor("captain.profile")
+    def anchor_link(self, instance):
+        return "Profile"
+
+
+class PkOnlyDeepOneToOneAdmin(BenchmarkAdmin):
+    @admin_anchor("captain.profile", pk_only=True)
+    def anchor_link(self, instance):
+        return "Profile"
+
+
+class ManyToManyCountAdmin(BenchmarkAdmin):
+    @admin_anchor("members", count=True)
+    def anchor_link(self, instance, count):
+        return f"{count} members"
+
+
+class ManyToManyHideEmptyAdmin(BenchmarkAdmin):
+    @admin_anchor("members", pk_only=True, hide_empty=True)
+    def anchor_link(self, instance):
+        return "Members"
+
+
+class ManyToManyPrefetchAdmin(BenchmarkAdmin):
+    @admin_anchor("members")
+    def anchor_link(self, instance):
+        return f"{len(instance.members.all())} members"
+
+
+# Queries of the changelist page itself: result counts and results.
+BASE_QUERIES = 3
+
+ADMINS = [
+    (ForeignKeyAdmin, BASE_QUERIES),
+    (PkOnlyForeignKeyAdmin, BASE_QUERIES),
+    (DeepOneToOneAdmin, BASE_QUERIES),
+    (PkOnlyDeepOneToOneAdmin, BASE_QUERIES + 1),
+    (ManyToManyCountAdmin, BASE_QUERIES),
+    (ManyToManyHideEmptyAdmin, BASE_QUERIES),
+    (ManyToManyPrefetchAdmin, BASE_QUERIES + 1),
+]
+
+
+def seed(rows: int) -> None:
+    players = Player.objects.bulk_create(
+        Player(name=f"Player {index}") for index in range(rows)
+    )
+    Profile.objects.bulk_create(Profile(player=player) for player in players)
+    teams = Team.objects.bulk_create(
+        Team(name=f"Team {index}", captain=player)
+        for index, player in enumerate(players)
+    )
+    Team.members.through.objects.bulk_create(
+        Team.members.through(team=team, player=player)
+        for team, player in zip(teams, players)
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("rows", ROWS)
+@pytest.mark.parametrize(
+    ("admin_class", "max_queries"),
+    ADMINS,
+    ids=[admin_class.__name__ for admin_class, _ in ADMINS],
+)
+def test_changelist(benchmark, rf, admin_user, admin_class, max_queries, rows):
+    seed(rows)
+    model_admin = admin_class(Team, admin.site)
+
+    def render_changelist():
+        request = rf.get("/admin/gaming/team/")
+        request.user = admin_user
+        model_admin.changelist_view(request).render()
+
+    with query_budget(max_queries):
+        benchmark(render_changelist, rounds=1)
@@ -0,0 +1,28 @@
+import pytest
+
+from tests.project.gaming.models import Player, Profile, Team
+
+
+@pytest.fixture
+def create_team():
+    def create_team(name="Team", member_count=1, using="default"):
+        captain = Player.objects.using(using).create(name=f"{name} captain")
+        Profile.objects.using(using).create(player=captain)
+        team = Team.objects.using(using).create(name=name, captain=captain)
+        team.members.add(
+            *[
+                Player.objects.using(using).create(name=f"{name} {index}")
+                for index in range(member_count)
+            ]
+        )
+        return team
+
+    return create_team
+
+
+@pytest.fixture
+def create_teams(create_team):
+    def create_teams(count, member_count=2):
+        return [create_team(f"Team {index}", member_count) for index in range(count)]
+
+    return create_teams
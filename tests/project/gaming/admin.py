@@ -1,11 +1,11 @@
 from django.contrib import admin
 
-from admin_anchors import admin_anchor
-from tests.project.gaming.models import Player, Profile, Team
+from admin_anchors import AdminAnchorsMixin, admin_anchor
+from tests.project.gaming.models import Comment, Player, Profile, Team
 
 
 @admin.register(Player)
-class PlayerAdmin(admin.ModelAdmin):
+class PlayerAdmin(AdminAnchorsMixin, admin.ModelAdmin):
     list_display = ["__str__", "profile_link", "teams_link", "led_teams_link"]
     readonly_fields = ["profile_link"]
 
@@ -13,30 +13,30 @@ class PlayerAdmin(admin.ModelAdmin):
     def profile_link(self, instance):
         return "Profile"
 
-    @admin_anchor("teams")
-    def teams_link(self, instance):
-        return f"{instance.teams.count()} teams"
+    @admin_anchor("teams", count=True)
+    def teams_link(self, instance, count):
+        return f"{count} teams"
 
-    @admin_anchor("led_teams")
-    def led_teams_link(self, instance):
-        return f"{instance.led_teams.count()} led teams"
+    @admin_anchor("led_teams", count=True)
+    def led_teams_link(self, instance, count):
+        return f"{count} led teams"
 
 
 @admin.register(Profile)
-class ProfileAdmin(admin.ModelAdmin):
+class ProfileAdmin(AdminAnchorsMixin, admin.ModelAdmin):
     list_display = ["__str__", "player_link", "player_teams_link"]
 
     @admin_anchor("player")
     def player_link(self, instance):
         return str(instance.player)
 
-    @admin_anchor("player.teams")
-    def player_teams_link(self, instance):
-        return f"{instance.player.teams.count()} teams"
+    @admin_anchor("player.teams", count=True)
+    def player_teams_link(self, instance, count):
+        return f"{count} teams"
 
 
 @admin.register(Team)
-class TeamAdmin(admin.ModelAdmin):
+class TeamAdmin(AdminAnchorsMixin, admin.ModelAdmin):
     list_display = ["__str__", "captain_link", "captains_profile_link", "members_link"]
 
     @admin_anchor("captain")
@@ -47,6 +47,15 @@ class TeamAdmin(admin.ModelAdmin):
     def captains_profile_link(self, instance):
         return "Captains profile"
 
-    @admin_anchor("members")
-    def members_link(self, instance):
-        return f"{instance.members.count()} members"
+    @admin_anchor("members", count=True, sortable=True)
+    def members_link(self, instance, count):
+        return f"{count} members"
+
+
+@admin.register(Comment)
+class CommentAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+    list_display = ["__str__", "content_object_link"]
+
+    @admin_anchor("content_object", change_view=True)
+    def content_object_link(self, instance):
+        return str(instance.content_object)
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gaming", "0003_optional_profile_player"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="led_teams_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="player",
+            name="teams_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="team",
+            name="members_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gaming", "0005_comment"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Club",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=32)),
+                (
+                    "members_count",
+                    models.PositiveIntegerField(default=0, editable=False),
+                ),
+                (
+                    "members",
+                    models.ManyToManyField(related_name="clubs", to="gaming.player"),
+                ),
+            ],
+        ),
+    ]
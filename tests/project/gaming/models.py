@@ -1,8 +1,12 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
 
 class Player(models.Model):
     name = models.CharField(max_length=32)
+    teams_count = models.PositiveIntegerField(default=0, editable=False)
+    led_teams_count = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return self.name
@@ -21,6 +25,7 @@ class Team(models.Model):
     name = models.CharField(max_length=32)
 
     members = models.ManyToManyField(Player, related_name="teams")
+    members_count = models.PositiveIntegerField(default=0, editable=False)
 
     captain = models.ForeignKey(
         Player,
@@ -32,3 +37,26 @@ class Team(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class Club(models.Model):
+    name = models.CharField(max_length=32)
+
+    members = models.ManyToManyField(Player, related_name="clubs")
+    members_count = models.PositiveIntegerField(default=0, editable=False)
+
+    def __str__(self):
+        return self.name
+
+
+class Comment(models.Model):
+    text = models.CharField(max_length=256)
+
+    content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, blank=True, null=True
+    )
+    object_id = models.PositiveIntegerField(blank=True, null=True)
+    content_object = GenericForeignKey("content_type", "object_id")
+
+    def __str__(self):
+        return self.text
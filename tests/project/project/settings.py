@@ -4,7 +4,22 @@ SECRET_KEY = "fake-key"
 
 ROOT_URLCONF = "tests.project.project.urls"
 
-DATABASES = {"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": "db.sqlite"}}
+DATABASES = {
+    "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": "db.sqlite"},
+    "other": {"ENGINE": "django.db.backends.sqlite3", "NAME": "other.sqlite"},
+}
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "admin_anchors": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "admin_anchors",
+        "TIMEOUT": 300,
+        "OPTIONS": {"MAX_ENTRIES": 10_000},
+    },
+}
+
+ADMIN_ANCHORS_CACHE = "admin_anchors"
 
 DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
@@ -15,6 +30,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.sessions",
     "django.contrib.staticfiles",
+    "admin_anchors",
     "tests.project.gaming",
 ]
 
@@ -0,0 +1,187 @@
+import pytest
+from django.contrib import admin
+from django.core.exceptions import ImproperlyConfigured
+
+from admin_anchors import admin_anchor
+from admin_anchors.anchors import compile_anchor_path
+from tests.project.gaming.admin import PlayerAdmin
+from tests.project.gaming.models import Player, Profile, Team
+
+
+@admin_anchor("player.teams")
+def player_teams_anchor(self, instance):
+    return "Teams"
+
+
+@pytest.fixture
+def player_admin():
+    return PlayerAdmin(Player, admin.site)
+
+
+def test_compiles_forward_path():
+    path = compile_anchor_path(Team, ("captain", "profile"))
+
+    assert path.parent_path == ("captain",)
+    assert path.field_name == "profile"
+    assert path.related_model is Profile
+    assert not path.many
+    assert path.query_key == "pk"
+    assert path.select_related == "captain__profile"
+    assert path.prefetch_related is None
+
+
+def test_compiles_to_many_path():
+    path = compile_anchor_path(Profile, ("player", "teams"))
+
+    assert path.parent_path == ("player",)
+    assert path.related_model is Team
+    assert path.many
+    assert path.query_key == "members__pk"
+    assert path.select_related == "player"
+    assert path.prefetch_related == "player__teams"
+
+
+def test_compiles_direct_to_many_path():
+    path = compile_anchor_path(Team, ("members",))
+
+    assert path.query_key == "teams__pk"
+    assert path.select_related is None
+    assert path.prefetch_related == "members"
+
+
+def test_rejects_non_relation_field_in_the_middle_of_the_path():
+    with pytest.raises(ImproperlyConfigured):
+        compile_anchor_path(Player, ("name", "profile"))
+
+
+def test_rejects_to_many_relation_in_the_middle_of_the_path():
+    with pytest.raises(ImproperlyConfigured):
+        compile_anchor_path(Player, ("teams", "captain"))
+
+
+def test_anchor_compiles_once_per_model():
+    anchor = player_teams_anchor.anchor
+
+    assert anchor.compile(Profile) is anchor.compile(Profile)
+    assert repr(anchor) == "<Anchor player_teams_anchor 'player.teams'>"
+
+
+@pytest.mark.django_db
+def test_indirect_to_many_query_uses_the_parent_pk():
+    Player.objects.create(name="Other")
+    player = Player.objects.create(name="John")
+    profile = Profile.objects.create(player=player)
+
+    assert profile.pk != player.pk
+    assert (
+        player_teams_anchor(None, profile)
+        == f"<a href='/admin/gaming/team/?members__pk={player.pk}'>Teams</a>"
+    )
+
+
+@pytest.mark.django_db
+def test_missing_reverse_one_to_one_in_the_middle_of_the_path(player_admin):
+    @admin_anchor("profile.player")
+    def profile_player_anchor(self, instance):
+        return "Player"
+
+    player = Player.objects.create(name="John")
+
+    assert profile_player_anchor(player_admin, player) == "-"
+
+
+@pytest.mark.django_db
+def test_count_is_queried_without_annotation(player_admin):
+    player = Player.objects.create(name="John")
+    Team.objects.create(name="Team", captain=player)
+
+    assert (
+        player_admin.led_teams_link(player)
+        == f"<a href='/admin/gaming/team/?captain__pk={player.pk}'>1 led teams</a>"
+    )
+
+
+def test_count_requires_a_to_many_relation():
+    @admin_anchor("captain", count=True)
+    def captain_anchor(self, instance, count):
+        return "Captain"
+
+    with pytest.raises(ImproperlyConfigured):
+        captain_anchor.anchor.compile(Team)
+
+
+@pytest.mark.django_db
+def test_foreign_key_anchor_reads_the_local_column(django_assert_num_queries):
+    @admin_anchor("captain", pk_only=True)
+    def captain_anchor(self, instance):
+        return f"Captain #{instance.captain_id}"
+
+    player = Player.objects.create(name="John")
+    team = Team.objects.create(name="Team", captain=player)
+    team = Team.objects.get(pk=team.pk)
+
+    with django_assert_num_queries(0):
+        assert (
+            captain_anchor(None, team)
+            == f"<a href='/admin/gaming/player/?pk={player.pk}'>Captain #{player.pk}</a>"
+        )
+
+
+def test_pk_only_anchors_skip_joining_relations():
+    @admin_anchor("captain", pk_only=True)
+    def captain_anchor(self, instance):
+        return "Captain"
+
+    @admin_anchor("player.teams", pk_only=True)
+    def player_teams_anchor(self, instance):
+        return "Teams"
+
+    @admin_anchor("captain.profile", pk_only=True)
+    def captains_profile_anchor(self, instance):
+        return "Profile"
+
+    assert captain_anchor.anchor.get_related_lookups(Team) == (None, None)
+    assert player_teams_anchor.anchor.get_related_lookups(Profile) == (None, None)
+    assert captains_profile_anchor.anchor.get_related_lookups(Team) == (None, None)
+
+
+@pytest.mark.django_db
+def test_empty_relation_is_queried_without_annotation(player_admin):
+    @admin_anchor("led_teams", hide_empty=True)
+    def led_teams_anchor(self, instance):
+        return "Led teams"
+
+    player = Player.objects.create(name="John")
+
+    assert led_teams_anchor(player_admin, player) == "-"
+
+    Team.objects.create(name="Team", captain=player)
+
+    assert led_teams_anchor(player_admin, player) == (
+        f"<a href='/admin/gaming/team/?captain__pk={player.pk}'>Led teams</a>"
+    )
+
+
+@pytest.mark.django_db
+def test_single_object_anchors_can_link_to_the_change_view(player_admin):
+    @admin_anchor("profile", change_view=True)
+    def profile_anchor(self, instance):
+        return "Profile"
+
+    player = Player.objects.create(name="John")
+    profile = Profile.objects.create(player=player)
+    link = profile_anchor.anchor.get_link(player_admin, player)
+
+    assert link.url == f"/admin/gaming/profile/{profile.pk}/change/"
+    assert profile_anchor(player_admin, player) == (
+        f"<a href='/admin/gaming/profile/{profile.pk}/change/'>Profile</a>"
+    )
+
+
+def test_change_view_links_require_a_single_object():
+    @admin_anchor("members", change_view=True)
+    def members_anchor(self, instance):
+        return "Members"
+
+    with pytest.raises(ImproperlyConfigured):
+        members_anchor.anchor.compile(Team)
@@ -0,0 +1,150 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib import admin
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from admin_anchors import (
+    admin_anchor,
+    aiter_render_anchors,
+    arender_anchors,
+    render_anchors,
+)
+from tests.project.gaming.models import Comment, Player, Team
+
+
+class TeamAdmin(admin.ModelAdmin):
+    @admin_anchor("captain", pk_only=True)
+    def captain_link(self, instance):
+        return "Captain"
+
+    @admin_anchor("captain.profile", pk_only=True)
+    def captains_profile_link(self, instance):
+        return "Profile"
+
+    @admin_anchor("members", count=True)
+    def members_link(self, instance, count):
+        return f"{count} members"
+
+    @admin_anchor("members", count=True, filter={"name__endswith": " 0"})
+    def first_members_link(self, instance, count):
+        return f"{count} first members"
+
+    @admin_anchor("members", count_limit=1)
+    def capped_members_link(self, instance, count):
+        return f"{count} members"
+
+    @admin_anchor("captain.led_teams", hide_empty=True)
+    def captains_teams_link(self, instance):
+        return "Captains teams"
+
+
+class CommentAdmin(admin.ModelAdmin):
+    @admin_anchor("content_object", change_view=True)
+    def content_object_link(self, instance):
+        return "Object"
+
+
+ANCHOR_NAMES = [
+    "captain_link",
+    "captains_profile_link",
+    "members_link",
+    "first_members_link",
+    "capped_members_link",
+    "captains_teams_link",
+]
+
+
+@pytest.fixture
+def team_admin():
+    return TeamAdmin(Team, admin.site)
+
+
+@pytest.fixture
+def teams(create_teams):
+    create_teams(3)
+    Team.objects.create(name="Empty")
+    return list(Team.objects.order_by("pk"))
+
+
+@pytest.mark.django_db
+def test_renders_the_same_anchors_as_the_sync_api(team_admin, teams):
+    expected = render_anchors(team_admin, teams, ANCHOR_NAMES)
+    teams = list(Team.objects.order_by("pk"))
+
+    with CaptureQueriesContext(connection) as context:
+        rendered = async_to_sync(arender_anchors)(team_admin, teams, ANCHOR_NAMES)
+
+    assert rendered == expected
+    assert len(context.captured_queries) == 6
+
+
+@pytest.mark.django_db
+def test_iterates_querysets_in_chunks(team_admin, teams):
+    async def render():
+        return [
+            (instance.pk, rendered)
+            async for instance, rendered in aiter_render_anchors(
+                team_admin, Team.objects.order_by("pk"), ["members_link"], chunk_size=3
+            )
+        ]
+
+    with CaptureQueriesContext(connection) as context:
+        rendered = async_to_sync(render)()
+
+    assert [pk for pk, _ in rendered] == [team.pk for team in teams]
+    assert rendered[0][1]["members_link"].endswith(">2 members</a>")
+    assert rendered[3][1]["members_link"].endswith(">0 members</a>")
+    assert len(context.captured_queries) == 1 + 2
+
+
+@pytest.mark.django_db
+def test_loads_content_types_of_generic_anchors_asynchronously():
+    comment_admin = CommentAdmin(Comment, admin.site)
+    player = Player.objects.create(name="Player")
+    comments = [
+        Comment.objects.create(text="On player", content_object=player),
+        Comment.objects.create(text="Without object"),
+    ]
+    ContentType.objects.clear_cache()
+
+    rendered = async_to_sync(arender_anchors)(
+        comment_admin, comments, ["content_object_link"]
+    )
+
+    assert rendered == [
+        {
+            "content_object_link": (
+                f"<a href='/admin/gaming/player/{player.pk}/change/'>Object</a>"
+            )
+        },
+        {"content_object_link": "-"},
+    ]
+
+
+@pytest.mark.django_db
+def test_loads_related_objects_of_labels_before_rendering(teams):
+    class CaptainTeamAdmin(admin.ModelAdmin):
+        @admin_anchor("captain")
+        def captain_link(self, instance):
+            return str(instance.captain)
+
+    teams = list(Team.objects.order_by("pk"))
+
+    rendered = async_to_sync(arender_anchors)(
+        CaptainTeamAdmin(Team, admin.site), teams, ["captain_link"]
+    )
+
+    assert [row["captain_link"] for row in rendered[:3]] == [
+        f"<a href='/admin/gaming/player/?pk={team.captain_id}'>{team.captain}</a>"
+        for team in teams[:3]
+    ]
+    assert rendered[3] == {"captain_link": "-"}
+
+
+@pytest.mark.django_db
+def test_renders_missing_instances_as_empty(team_admin):
+    assert async_to_sync(arender_anchors)(team_admin, [None], ["members_link"]) == [
+        {"members_link": "-"}
+    ]
@@ -0,0 +1,176 @@
+import pytest
+from django.contrib import admin
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from admin_anchors import AdminAnchorsMixin, admin_anchor
+from admin_anchors.caching import get_anchor_cache, get_generation_key
+from tests.project.gaming.models import Player, Profile, Team
+
+label_calls = []
+
+
+class TeamAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+    @admin_anchor("members", count=True, cache=True)
+    def members_link(self, instance, count):
+        label_calls.append(instance)
+        return f"{count} members"
+
+    @admin_anchor("captain", cache=True, cache_version_field="name")
+    def captain_link(self, instance):
+        label_calls.append(instance)
+        return str(instance.captain)
+
+    @admin_anchor("captain.profile", cache=True)
+    def captains_profile_link(self, instance):
+        label_calls.append(instance)
+        return "Profile"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    get_anchor_cache().clear()
+    label_calls.clear()
+
+
+@pytest.fixture
+def team_admin():
+    return TeamAdmin(Team, admin.site)
+
+
+@pytest.fixture
+def team():
+    captain = Player.objects.create(name="Captain")
+    team = Team.objects.create(name="Team", captain=captain)
+    team.members.add(captain)
+    return team
+
+
+@pytest.mark.django_db
+def test_renders_from_cache(team_admin, team, django_assert_num_queries):
+    link = team_admin.members_link(team)
+
+    with django_assert_num_queries(0):
+        assert team_admin.members_link(team) == link
+
+    assert label_calls == [team]
+    assert link == f"<a href='/admin/gaming/player/?teams__pk={team.pk}'>1 members</a>"
+
+
+@pytest.mark.django_db
+def test_m2m_changes_invalidate_the_cache(team_admin, team):
+    team_admin.members_link(team)
+    team.members.add(Player.objects.create(name="Member"))
+
+    assert team_admin.members_link(team).endswith(">2 members</a>")
+    assert len(label_calls) == 2
+
+
+@pytest.mark.django_db
+def test_saving_related_objects_invalidates_the_cache(team_admin, team):
+    team_admin.members_link(team)
+    Player.objects.create(name="Unrelated")
+    team_admin.members_link(team)
+
+    assert len(label_calls) == 2
+
+
+@pytest.mark.django_db
+def test_version_field_is_used_as_version(team_admin, team):
+    team_admin.captain_link(team)
+    Player.objects.create(name="Unrelated")
+    team_admin.captain_link(team)
+
+    assert len(label_calls) == 1
+
+    team.name = "Renamed"
+    team_admin.captain_link(team)
+
+    assert len(label_calls) == 2
+
+
+@pytest.mark.django_db
+def test_empty_anchors_are_cached(team_admin, django_assert_num_queries):
+    team = Team.objects.create(name="Team")
+
+    assert team_admin.captains_profile_link(team) == "-"
+
+    with django_assert_num_queries(0):
+        assert team_admin.captains_profile_link(team) == "-"
+
+
+@pytest.mark.django_db
+def test_evicted_generations_start_over(team_admin, team):
+    team_admin.members_link(team)
+    get_anchor_cache().delete(get_generation_key(Team))
+    team_admin.members_link(team)
+
+    assert len(label_calls) == 2
+
+
+@pytest.mark.django_db
+def test_models_are_tracked_before_the_first_render(team_admin):
+    cache = get_anchor_cache()
+    player = Player.objects.create(name="Player")
+    generation = cache.get(get_generation_key(Profile))
+
+    Profile.objects.create(player=player)
+
+    assert cache.get(get_generation_key(Profile)) != generation
+
+
+@pytest.mark.django_db
+def test_changelist_counts_cache_misses_per_page(rf, admin_user, team_admin, team):
+    other = Team.objects.create(name="Other")
+    request = rf.get("/admin/gaming/team/")
+    request.user = admin_user
+    team_admin.list_display = ["name", "members_link"]
+    team_admin.members_link(team)
+
+    with CaptureQueriesContext(connection) as context:
+        response = team_admin.changelist_view(request)
+        response.render()
+
+    changelist_queryset = response.context_data["cl"].queryset
+    assert "anchor_members_link_count" not in changelist_queryset.query.annotations
+    count_queries = [
+        query["sql"] for query in context.captured_queries if "GROUP BY" in query["sql"]
+    ]
+    assert len(count_queries) == 1
+    assert label_calls == [team, other]
+
+
+@pytest.mark.django_db
+def test_empty_pages_do_not_read_the_cache(team_admin, django_assert_num_queries):
+    anchor = TeamAdmin.members_link.anchor
+
+    with django_assert_num_queries(0):
+        assert anchor.prefetch_cached_links(team_admin, []) == []
+
+
+@pytest.mark.django_db
+def test_changelist_reads_the_cache_once_per_page(
+    rf, admin_user, team_admin, create_teams, monkeypatch
+):
+    cache = get_anchor_cache()
+    get_many = cache.get_many
+    get_many_calls = []
+
+    def counting_get_many(keys, *args, **kwargs):
+        get_many_calls.append(list(keys))
+        return get_many(keys, *args, **kwargs)
+
+    monkeypatch.setattr(cache, "get_many", counting_get_many)
+    request = rf.get("/admin/gaming/team/")
+    request.user = admin_user
+    team_admin.list_display = ["name", "members_link"]
+    create_teams(20)
+
+    for rendered_labels in (20, 0):
+        get_many_calls.clear()
+        label_calls.clear()
+        team_admin.changelist_view(request).render()
+
+        # One read of the three model generations and one of the page's links.
+        assert [len(keys) for keys in get_many_calls] == [3, 20]
+        assert len(label_calls) == rendered_labels
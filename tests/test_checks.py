@@ -0,0 +1,231 @@
+import pytest
+from django.apps import apps
+from django.contrib import admin
+from django.core import checks
+
+from admin_anchors import AdminAnchorsMixin, admin_anchor
+from admin_anchors.checks import check_anchors, check_installed_apps
+from tests.project.gaming.models import Player, Profile, Team
+
+
+class InvalidTeamAdmin(admin.ModelAdmin):
+    @admin_anchor("captain.NON_EXISTING_FIELD")
+    def missing_field_link(self, instance):
+        return ""
+
+    @admin_anchor("name")
+    def non_relation_link(self, instance):
+        return ""
+
+
+class PlainTeamAdmin(admin.ModelAdmin):
+    list_display = [
+        "name",
+        "captain_link",
+        "captains_profile_link",
+        "members_link",
+        "teams_link",
+    ]
+
+    @admin_anchor("captain")
+    def captain_link(self, instance):
+        return "Captain"
+
+    @admin_anchor("captain.profile")
+    def captains_profile_link(self, instance):
+        return "Profile"
+
+    @admin_anchor("members", count=True)
+    def members_link(self, instance, count):
+        return f"{count} members"
+
+    @admin_anchor("captain.led_teams", hide_empty=True)
+    def teams_link(self, instance):
+        return "Led teams"
+
+
+class SelectedProfileAdmin(admin.ModelAdmin):
+    list_display = ["player_teams_link"]
+    list_select_related = ["player"]
+
+    @admin_anchor("player.teams")
+    def player_teams_link(self, instance):
+        return "Teams"
+
+
+class AnchoredTeamAdmin(AdminAnchorsMixin, PlainTeamAdmin):
+    pass
+
+
+class SelectAllProfileAdmin(SelectedProfileAdmin):
+    list_select_related = True
+
+
+class QuerysetProfileAdmin(SelectedProfileAdmin):
+    list_select_related = False
+    readonly_fields = ["player_link"]
+
+    @admin_anchor("player.profile")
+    def player_link(self, instance):
+        return "Player"
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related()
+
+
+class PartialTeamAdmin(admin.ModelAdmin):
+    list_display = ["captains_profile_link", "lazy_members_link", "captain_link"]
+
+    @admin_anchor("captain.profile")
+    def captains_profile_link(self, instance):
+        return "Profile"
+
+    @admin_anchor("members", count=True, lazy=True)
+    def lazy_members_link(self, instance, count):
+        return f"{count} members"
+
+    @admin_anchor("captain.profile", pk_only=True)
+    def captain_link(self, instance):
+        return "Captain"
+
+    @admin_anchor("members", count=True, filter={"name__startswith": "A"})
+    def filtered_members_link(self, instance, count):
+        return f"{count} members"
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("captain")
+
+
+class PkOnlyTeamAdmin(AdminAnchorsMixin, PartialTeamAdmin):
+    list_display = ["captain_link", "filtered_members_link"]
+
+
+class RequestTeamAdmin(PlainTeamAdmin):
+    def get_queryset(self, request):
+        return super().get_queryset(request).filter(captain=request.user)
+
+
+class BrokenTeamAdmin(PlainTeamAdmin):
+    def get_queryset(self, request):
+        return super().get_queryset(request).filter(NON_EXISTING_FIELD=1)
+
+
+@pytest.fixture
+def site():
+    return admin.AdminSite(name="checks")
+
+
+def get_messages(site):
+    return [
+        (message.id, message.msg.split(" ")[0])
+        for message in check_anchors()
+        if message.obj in {type(model_admin) for model_admin in site._registry.values()}
+    ]
+
+
+def test_invalid_paths_are_errors(site):
+    site.register(Team, InvalidTeamAdmin)
+    messages = check_anchors()
+
+    assert [message.id for message in messages if message.obj is InvalidTeamAdmin] == [
+        "admin_anchors.E001",
+        "admin_anchors.E001",
+    ]
+    assert all(isinstance(message, checks.Error) for message in messages)
+
+
+def test_uncovered_hops_and_missing_annotations_are_warnings(site):
+    site.register(Team, PlainTeamAdmin)
+
+    assert get_messages(site) == [
+        ("admin_anchors.W001", "PlainTeamAdmin.captains_profile_link"),
+        ("admin_anchors.W002", "PlainTeamAdmin.members_link"),
+        ("admin_anchors.W001", "PlainTeamAdmin.teams_link"),
+        ("admin_anchors.W002", "PlainTeamAdmin.teams_link"),
+    ]
+
+
+def test_partially_selected_paths_are_warnings(site):
+    site.register(Team, PartialTeamAdmin)
+
+    assert get_messages(site) == [
+        ("admin_anchors.W001", "PartialTeamAdmin.captain_link"),
+        ("admin_anchors.W001", "PartialTeamAdmin.captains_profile_link"),
+        ("admin_anchors.E004", "PartialTeamAdmin.lazy_members_link"),
+    ]
+
+
+def test_lazy_anchors_require_the_mixin(site):
+    site.register(Team, PartialTeamAdmin)
+    messages = [
+        message
+        for message in check_anchors()
+        if message.obj is PartialTeamAdmin and message.id == "admin_anchors.E004"
+    ]
+
+    assert messages
+    assert all(isinstance(message, checks.Error) for message in messages)
+
+
+def test_strict_checks_promote_warnings_to_errors(site, settings):
+    settings.ADMIN_ANCHORS_STRICT_CHECKS = True
+    site.register(Team, PlainTeamAdmin)
+
+    assert {message_id for message_id, _ in get_messages(site)} == {
+        "admin_anchors.E002",
+        "admin_anchors.E003",
+    }
+
+
+@pytest.mark.parametrize(
+    "model, admin_class",
+    [
+        (Team, AnchoredTeamAdmin),
+        (Team, PkOnlyTeamAdmin),
+        (Profile, SelectedProfileAdmin),
+        (Profile, SelectAllProfileAdmin),
+        (Profile, QuerysetProfileAdmin),
+    ],
+)
+def test_covered_anchors_pass(site, model, admin_class):
+    site.register(model, admin_class)
+
+    assert get_messages(site) == []
+
+
+def test_admins_with_request_dependent_querysets_are_skipped(site):
+    site.register(Team, RequestTeamAdmin)
+
+    assert get_messages(site) == [("admin_anchors.W003", "RequestTeamAdmin")]
+
+
+def test_broken_changelist_querysets_are_warnings(site):
+    site.register(Team, BrokenTeamAdmin)
+    messages = [
+        message for message in check_anchors() if message.obj is BrokenTeamAdmin
+    ]
+
+    assert [message.id for message in messages] == ["admin_anchors.W003"]
+    assert isinstance(messages[0], checks.Warning)
+    assert "could not build the changelist queryset" in messages[0].msg
+
+
+def test_checks_are_limited_to_the_given_app_configs(site):
+    site.register(Player, InvalidTeamAdmin)
+
+    assert check_anchors(app_configs=[]) == []
+
+
+@pytest.mark.parametrize(
+    "names, expected",
+    [
+        (["django.contrib.admin", "admin_anchors"], []),
+        (["admin_anchors"], []),
+        (["admin_anchors", "django.contrib.admin"], ["admin_anchors.E005"]),
+    ],
+)
+def test_admin_anchors_are_installed_after_the_admin(monkeypatch, names, expected):
+    app_configs = [type("AppConfig", (), {"name": name}) for name in names]
+    monkeypatch.setattr(apps, "get_app_configs", lambda: app_configs)
+
+    assert [message.id for message in check_installed_apps()] == expected
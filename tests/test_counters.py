@@ -0,0 +1,233 @@
+import pytest
+from django.apps import apps
+from django.contrib import admin
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db.models import F
+
+from admin_anchors import AdminAnchorsMixin, admin_anchor, render_anchors
+from admin_anchors.apps import AdminAnchorsConfig
+from admin_anchors.counters import get_counter_caches, register_counter_cache
+from admin_anchors.registry import connect_anchor_counters
+from tests.project.gaming.models import Club, Player, Team
+
+
+class CountedTeamAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+    list_display = ["name", "members_link"]
+
+    @admin_anchor("members", count_field="members_count", sortable=True)
+    def members_link(self, instance, count):
+        return f"{count} members"
+
+
+class CountedPlayerAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+    list_display = ["name", "teams_link", "led_teams_link"]
+
+    @admin_anchor("teams", count_field="teams_count")
+    def teams_link(self, instance, count):
+        return f"{count} teams"
+
+    @admin_anchor("led_teams", count_field="led_teams_count", hide_empty=True)
+    def led_teams_link(self, instance, count):
+        return f"{count} led teams"
+
+
+@pytest.fixture(autouse=True)
+def counted_admins():
+    return CountedTeamAdmin(Team, admin.site), CountedPlayerAdmin(Player, admin.site)
+
+
+def get_members_count(team):
+    return Team.objects.values_list("members_count", flat=True).get(pk=team.pk)
+
+
+def get_teams_count(player):
+    return Player.objects.values_list("teams_count", flat=True).get(pk=player.pk)
+
+
+def get_led_teams_count(player):
+    return Player.objects.values_list("led_teams_count", flat=True).get(pk=player.pk)
+
+
+@pytest.mark.django_db
+def test_many_to_many_counters_follow_both_sides_of_the_relation():
+    team = Team.objects.create(name="Team")
+    players = [Player.objects.create(name=f"Player {i}") for i in range(3)]
+
+    team.members.add(*players)
+    assert get_members_count(team) == 3
+    assert get_teams_count(players[0]) == 1
+
+    team.members.remove(players[0])
+    assert get_members_count(team) == 2
+
+    players[1].teams.remove(team)
+    assert get_members_count(team) == 1
+
+    players[0].teams.add(team)
+    assert get_members_count(team) == 2
+
+    players[0].teams.clear()
+    assert get_members_count(team) == 1
+    assert get_teams_count(players[0]) == 0
+
+    team.delete()
+    assert get_teams_count(players[1]) == 0
+    team = Team.objects.create(name="Team")
+    team.members.add(players[2])
+
+    players[2].delete()
+    assert get_members_count(team) == 0
+
+    team.members.add(players[1])
+    team.members.clear()
+    assert get_members_count(team) == 0
+
+
+@pytest.mark.django_db
+def test_counters_with_the_same_field_name_are_kept_apart():
+    class CountedClubAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+        @admin_anchor("members", count_field="members_count")
+        def members_link(self, instance, count):
+            return f"{count} members"
+
+    CountedClubAdmin(Club, admin.site)
+    team = Team.objects.create(name="Team")
+    club = Club.objects.create(name="Club")
+    player = Player.objects.create(name="Player")
+    team.members.add(player)
+    club.members.add(player)
+
+    player.delete()
+
+    assert get_members_count(team) == 0
+    assert Club.objects.values_list("members_count", flat=True).get() == 0
+
+
+@pytest.mark.django_db
+def test_foreign_key_counters_follow_saves_and_deletes():
+    alice = Player.objects.create(name="Alice")
+    bob = Player.objects.create(name="Bob")
+    team = Team.objects.create(name="Team", captain=alice)
+    Team.objects.create(name="Other team", captain=alice)
+    assert get_led_teams_count(alice) == 2
+
+    team.captain = bob
+    team.save()
+    assert get_led_teams_count(alice) == 1
+    assert get_led_teams_count(bob) == 1
+
+    team.name = "Renamed"
+    team.save()
+    assert get_led_teams_count(bob) == 1
+
+    team.delete()
+    assert get_led_teams_count(bob) == 0
+
+
+@pytest.mark.django_db
+def test_counter_fields_are_read_without_queries(
+    counted_admins, rf, django_assert_num_queries
+):
+    team_admin, player_admin = counted_admins
+    team = Team.objects.create(name="Team")
+    team.members.add(Player.objects.create(name="Player"))
+    queryset = team_admin.get_queryset(rf.get("/"))
+
+    assert "anchor_members_link_count" not in queryset.query.annotations
+    assert team_admin.members_link.anchor.get_order_expression(Team) == F(
+        "members_count"
+    )
+
+    with django_assert_num_queries(1):
+        (team,) = queryset
+        assert team_admin.members_link(team).endswith(">1 members</a>")
+
+
+@pytest.mark.django_db
+def test_counter_fields_are_rendered_without_count_queries(
+    counted_admins, django_assert_num_queries
+):
+    team_admin, _ = counted_admins
+    team = Team.objects.create(name="Team")
+    team.members.add(Player.objects.create(name="Player"))
+    team.refresh_from_db()
+
+    with django_assert_num_queries(0):
+        (rendered,) = render_anchors(team_admin, [team], ["members_link"])
+
+    assert rendered["members_link"].endswith(">1 members</a>")
+
+
+@pytest.mark.django_db
+def test_empty_counters_hide_anchors(counted_admins, rf):
+    _, player_admin = counted_admins
+    player = Player.objects.create(name="Player")
+    queryset = player_admin.get_queryset(rf.get("/"))
+
+    assert not queryset.query.annotations
+    assert player_admin.led_teams_link(queryset.get(pk=player.pk)) == "-"
+
+
+@pytest.mark.django_db
+def test_recompute_command_updates_counters_in_bulk(django_assert_num_queries):
+    team = Team.objects.create(name="Team")
+    team.members.add(Player.objects.create(name="Player"))
+    captain = Player.objects.create(name="Captain")
+    Team.objects.bulk_create([Team(name="Bulk", captain=captain)])
+    Team.objects.update(members_count=0)
+
+    call_command("recompute_anchor_counters", "gaming.Team.members_count")
+    assert get_members_count(team) == 1
+    assert get_led_teams_count(captain) == 0
+
+    with django_assert_num_queries(len(get_counter_caches())):
+        call_command("recompute_anchor_counters")
+    assert get_led_teams_count(captain) == 1
+
+
+def test_counter_caches_require_a_single_to_many_hop():
+    class InvalidAdmin(admin.ModelAdmin):
+        @admin_anchor("captain.teams", count_field="members_count")
+        def nested_teams_link(self, instance, count):
+            return ""
+
+        @admin_anchor("members", count_field="name")
+        def members_link(self, instance, count):
+            return ""
+
+        @admin_anchor("teams", count_field="led_teams_count")
+        def captains_teams_link(self, instance, count):
+            return ""
+
+    with pytest.raises(ImproperlyConfigured):
+        InvalidAdmin.nested_teams_link.anchor.compile(Team)
+    with pytest.raises(ImproperlyConfigured):
+        InvalidAdmin.members_link.anchor.compile(Team)
+    with pytest.raises(ImproperlyConfigured):
+        InvalidAdmin.captains_teams_link.anchor.compile(Player)
+
+
+def test_counter_caches_are_registered_once():
+    path = CountedTeamAdmin.members_link.anchor.compile(Team)
+
+    assert register_counter_cache(path, "members_count") in get_counter_caches()
+    assert len(get_counter_caches()) == len(set(get_counter_caches()))
+
+
+def test_counters_of_registered_admins_are_connected_on_startup():
+    class LedTeamsAdmin(admin.ModelAdmin):
+        @admin_anchor("led_teams", count_field="led_teams_count")
+        def led_teams_link(self, instance, count):
+            return f"{count} led teams"
+
+        @admin_anchor("NON_EXISTING_FIELD", count_field="led_teams_count")
+        def invalid_link(self, instance, count):
+            return ""
+
+    site = admin.AdminSite(name="counters")
+    site.register(Player, LedTeamsAdmin)
+    connect_anchor_counters()
+
+    assert isinstance(apps.get_app_config("admin_anchors"), AdminAnchorsConfig)
+    assert Player in LedTeamsAdmin.led_teams_link.anchor._paths
@@ -0,0 +1,90 @@
+import pytest
+from django.contrib import admin
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from admin_anchors import AdminAnchorsMixin, admin_anchor, render_anchors
+from admin_anchors.expressions import CappedCountSubquery
+from tests.project.gaming.models import Player, Team
+
+
+class PlayerAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+    list_display = ["teams_link"]
+
+    @admin_anchor("teams", count_limit=2)
+    def teams_link(self, instance, count):
+        return f"{count} teams"
+
+
+@pytest.fixture
+def player_admin():
+    return PlayerAdmin(Player, admin.site)
+
+
+@pytest.fixture
+def players():
+    players = [Player.objects.create(name=f"Player {index}") for index in range(4)]
+
+    for index, player in enumerate(players):
+        for team_index in range(index + 1):
+            Team.objects.create(name=f"Team {team_index}").members.add(player)
+
+    return players
+
+
+def labels(rendered):
+    return [anchors["teams_link"].rsplit("'>", 1)[1] for anchors in rendered]
+
+
+@pytest.mark.django_db
+def test_annotates_capped_counts(rf, player_admin, players, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        annotated = list(player_admin.get_queryset(rf.get("/")).order_by("pk"))
+
+    assert [player.anchor_teams_link_count for player in annotated] == [1, 2, 3, 3]
+
+    with django_assert_num_queries(0):
+        rendered = [{"teams_link": player_admin.teams_link(p)} for p in annotated]
+
+    assert labels(rendered) == [
+        "1 teams</a>",
+        "2 teams</a>",
+        "2+ teams</a>",
+        "2+ teams</a>",
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("vendor", ["mysql", "oracle"])
+def test_caps_counts_without_derived_tables(
+    rf, player_admin, players, monkeypatch, vendor
+):
+    fallback = getattr(CappedCountSubquery, f"as_{vendor}")
+    monkeypatch.setattr(CappedCountSubquery, "as_sql", fallback)
+
+    with CaptureQueriesContext(connection) as context:
+        annotated = list(player_admin.get_queryset(rf.get("/")).order_by("pk"))
+
+    assert [player.anchor_teams_link_count for player in annotated] == [1, 2, 3, 3]
+    assert "anchor_capped_count" not in context.captured_queries[0]["sql"]
+
+
+@pytest.mark.django_db
+def test_queries_capped_counts_per_row(player_admin, players):
+    assert player_admin.teams_link(players[3]).endswith(">2+ teams</a>")
+    assert player_admin.teams_link(players[1]).endswith(">2 teams</a>")
+
+
+@pytest.mark.django_db
+def test_resolves_capped_counts_in_batch(
+    player_admin, players, django_assert_num_queries
+):
+    with django_assert_num_queries(1):
+        rendered = render_anchors(player_admin, players, ["teams_link"])
+
+    assert labels(rendered) == [
+        "1 teams</a>",
+        "2 teams</a>",
+        "2+ teams</a>",
+        "2+ teams</a>",
+    ]
@@ -0,0 +1,121 @@
+import pytest
+from django.contrib import admin
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+from admin_anchors import admin_anchor, render_anchors
+from tests.project.gaming.models import Team
+
+DATABASES = ["default", "other"]
+
+
+class TeamAdmin(admin.ModelAdmin):
+    @admin_anchor("captain.profile", pk_only=True)
+    def captains_profile_link(self, instance):
+        return "Profile"
+
+    @admin_anchor("members", count=True)
+    def members_link(self, instance, count):
+        return f"{count} members"
+
+    @admin_anchor("members", count_limit=1)
+    def capped_members_link(self, instance, count):
+        return f"{count} members"
+
+    @admin_anchor("captain.led_teams", hide_empty=True)
+    def captains_teams_link(self, instance):
+        return "Led teams"
+
+
+ANCHOR_NAMES = [
+    "captains_profile_link",
+    "members_link",
+    "capped_members_link",
+    "captains_teams_link",
+]
+
+
+class OtherDatabaseRouter:
+    def db_for_read(self, model, **hints):
+        return "other"
+
+
+@pytest.fixture
+def team_admin():
+    return TeamAdmin(Team, admin.site)
+
+
+def render_per_database(team_admin, teams):
+    contexts = {using: CaptureQueriesContext(connections[using]) for using in DATABASES}
+
+    for context in contexts.values():
+        context.__enter__()
+
+    try:
+        rows = render_anchors(team_admin, teams, ANCHOR_NAMES)
+    finally:
+        for context in contexts.values():
+            context.__exit__(None, None, None)
+
+    return rows, {using: len(context) for using, context in contexts.items()}
+
+
+@pytest.mark.django_db(databases=DATABASES)
+def test_anchors_are_resolved_on_the_database_of_each_instance(team_admin, create_team):
+    default_team = create_team(member_count=1, using="default")
+    other_teams = [
+        create_team(member_count=2, using="other"),
+        create_team(member_count=3, using="other"),
+    ]
+    teams = [
+        Team.objects.get(pk=default_team.pk),
+        *Team.objects.using("other").filter(pk__in=[t.pk for t in other_teams]),
+    ]
+
+    rows, queries = render_per_database(team_admin, teams)
+
+    # Captains and their teams, one merged path-value query, two counts and one
+    # exists check per database.
+    assert queries == {"default": 6, "other": 6}
+    assert [row["members_link"][-14:] for row in rows] == [
+        ">1 members</a>",
+        ">2 members</a>",
+        ">3 members</a>",
+    ]
+    assert [row["capped_members_link"].split(">")[1] for row in rows] == [
+        "1 members</a",
+        "1+ members</a",
+        "1+ members</a",
+    ]
+    assert rows[0]["captains_profile_link"].endswith(
+        f"?pk={default_team.captain.profile.pk}'>Profile</a>"
+    )
+    assert rows[1]["captains_profile_link"].endswith(
+        f"?pk={other_teams[0].captain.profile.pk}'>Profile</a>"
+    )
+
+
+@pytest.mark.django_db(databases=DATABASES)
+def test_anchor_queries_follow_database_routers(team_admin, settings, create_team):
+    team = create_team(member_count=2, using="other")
+    settings.DATABASE_ROUTERS = [f"{__name__}.OtherDatabaseRouter"]
+    team = Team.objects.get(pk=team.pk)
+
+    rows, queries = render_per_database(team_admin, [team])
+
+    assert queries == {"default": 0, "other": 6}
+    assert rows[0]["members_link"].endswith(">2 members</a>")
+
+
+@pytest.mark.django_db(databases=DATABASES)
+def test_fallback_queries_use_the_database_of_the_instance(team_admin, create_team):
+    team = Team.objects.using("other").get(
+        pk=create_team(member_count=2, using="other").pk
+    )
+
+    with CaptureQueriesContext(connections["default"]) as context:
+        assert team_admin.members_link(team).endswith(">2 members</a>")
+        assert team_admin.capped_members_link(team).endswith(">1+ members</a>")
+        assert team_admin.captains_teams_link(team).endswith(">Led teams</a>")
+
+    assert len(context) == 0
@@ -0,0 +1,166 @@
+import csv
+import io
+import json
+
+import pytest
+from django.contrib import admin
+from django.contrib.auth.models import Permission
+
+from admin_anchors import AdminAnchorsMixin, admin_anchor
+from admin_anchors.export import (
+    export_anchors_csv,
+    export_anchors_json,
+    get_column_value,
+    iter_export_rows,
+)
+from tests.project.gaming.models import Player, Team
+
+
+class TeamAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+    list_display = [
+        "name",
+        "captain_id",
+        "captain_link",
+        "members_link",
+        "empty_teams_link",
+        str,
+    ]
+    actions = [export_anchors_csv, export_anchors_json]
+
+    @admin_anchor("captain", pk_only=True)
+    def captain_link(self, instance):
+        return "Captain"
+
+    @admin_anchor("members", count=True)
+    def members_link(self, instance, count):
+        return f"{count} members"
+
+    @admin_anchor("captain.led_teams", hide_empty=True)
+    def empty_teams_link(self, instance):
+        return "Led teams"
+
+
+@pytest.fixture
+def team_admin():
+    return TeamAdmin(Team, admin.site)
+
+
+@pytest.fixture
+def export_request(rf, admin_user):
+    request = rf.post("/admin/gaming/team/")
+    request.user = admin_user
+    return request
+
+
+def read_content(response):
+    return b"".join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db
+def test_csv_export_contains_anchor_labels_and_absolute_urls(
+    team_admin, export_request, create_teams
+):
+    create_teams(2, member_count=1)
+    team = Team.objects.order_by("pk").first()
+    queryset = team_admin.get_queryset(export_request).order_by("pk")
+
+    response = export_anchors_csv(team_admin, export_request, queryset)
+    rows = list(csv.reader(io.StringIO(read_content(response))))
+
+    assert response["Content-Type"] == "text/csv"
+    assert response["Content-Disposition"] == 'attachment; filename="team.csv"'
+    assert rows[0] == [
+        "Name",
+        "Captain id",
+        "Captain link",
+        "Captain link URL",
+        "Members link",
+        "Members link URL",
+        "Empty teams link",
+        "Empty teams link URL",
+    ]
+    assert rows[1] == [
+        "Team 0",
+        str(team.captain_id),
+        "Captain",
+        f"http://testserver/admin/gaming/player/?pk={team.captain_id}",
+        "1 members",
+        f"http://testserver/admin/gaming/player/?teams__pk={team.pk}",
+        "Led teams",
+        f"http://testserver/admin/gaming/team/?captain__pk={team.captain_id}",
+    ]
+    assert len(rows) == 3
+
+
+@pytest.mark.django_db
+def test_json_export_contains_anchor_labels_and_absolute_urls(
+    team_admin, export_request, create_teams
+):
+    create_teams(1, member_count=1)
+    Team.objects.update(captain=None)
+    team = Team.objects.get()
+
+    response = export_anchors_json(
+        team_admin, export_request, team_admin.get_queryset(export_request)
+    )
+
+    assert response["Content-Type"] == "application/json"
+    assert json.loads(read_content(response)) == [
+        {
+            "name": "Team 0",
+            "captain_id": None,
+            "captain_link": {"label": None, "url": None},
+            "members_link": {
+                "label": "1 members",
+                "url": f"http://testserver/admin/gaming/player/?teams__pk={team.pk}",
+            },
+            "empty_teams_link": {"label": None, "url": None},
+        }
+    ]
+
+
+@pytest.mark.django_db
+def test_json_export_of_empty_querysets_is_valid(team_admin, export_request):
+    response = export_anchors_json(team_admin, export_request, Team.objects.none())
+
+    assert json.loads(read_content(response)) == []
+
+
+@pytest.mark.django_db
+def test_export_omits_urls_without_view_permission(
+    team_admin, rf, django_user_model, create_teams
+):
+    create_teams(1, member_count=1)
+    user = django_user_model.objects.create_user("viewer", is_staff=True)
+    user.user_permissions.add(Permission.objects.get(codename="view_team"))
+    request = rf.post("/admin/gaming/team/")
+    request.user = user
+
+    (row,) = iter_export_rows(team_admin, request, Team.objects.all())
+
+    assert row["members_link"] == {"label": "1 members", "url": None}
+
+
+@pytest.mark.django_db
+def test_export_queries_grow_per_chunk_not_per_row(
+    team_admin, export_request, django_assert_num_queries, create_teams
+):
+    create_teams(12, member_count=1)
+    queryset = team_admin.get_queryset(export_request)
+
+    # The rows are fetched by a single cursor on SQLite, followed by one query
+    # per chunk for the captain pks and one for the led teams.
+    with django_assert_num_queries(1 + 3 * 2):
+        rows = list(iter_export_rows(team_admin, export_request, queryset, 5))
+
+    assert len(rows) == 12
+
+
+@pytest.mark.django_db
+def test_missing_related_objects_are_exported_as_empty_values():
+    player = Player.objects.create(name="Player")
+    model_admin = admin.ModelAdmin(Player, admin.site)
+
+    assert get_column_value(model_admin, player, "profile") is None
+    assert get_column_value(model_admin, player, "pk") == player.pk
+    assert get_column_value(model_admin, player, "name") == "Player"
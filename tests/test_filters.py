@@ -0,0 +1,159 @@
+from html import unescape
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from django.contrib import admin
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from admin_anchors import AdminAnchorsMixin, admin_anchor, render_anchors
+from admin_anchors.anchors import Anchor
+from tests.project.gaming.models import Player, Team
+
+
+class FilteredTeamAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+    list_display = ["name", "members_link", "active_members_link", "retired_link"]
+
+    @admin_anchor("members", count=True)
+    def members_link(self, instance, count):
+        return f"{count} members"
+
+    @admin_anchor("members", count=True, filter={"name__startswith": "Active"})
+    def active_members_link(self, instance, count):
+        return f"{count} active"
+
+    @admin_anchor("members", filter={"name__startswith": "Retired"}, hide_empty=True)
+    def retired_link(self, instance):
+        return "Retired"
+
+
+class PlainTeamAdmin(admin.ModelAdmin):
+    list_display = ["name", "active_members_link"]
+
+    @admin_anchor("members", count_limit=1, filter={"name__startswith": "Active"})
+    def active_members_link(self, instance, count):
+        return f"{count} active"
+
+
+@pytest.fixture
+def team_admin():
+    return FilteredTeamAdmin(Team, admin.site)
+
+
+@pytest.fixture
+def teams():
+    teams = []
+
+    for index in range(3):
+        team = Team.objects.create(name=f"Team {index}")
+        team.members.add(
+            *[Player.objects.create(name=f"Active {i}") for i in range(index + 1)],
+            *[Player.objects.create(name=f"Retired {i}") for i in range(index)],
+        )
+        teams.append(team)
+
+    return teams
+
+
+def label(html):
+    return html.rsplit("'>", 1)[1].removesuffix("</a>") if "href" in html else html
+
+
+@pytest.mark.django_db
+def test_link_includes_filter(team_admin, teams):
+    html = team_admin.active_members_link(teams[0])
+    url = urlparse(unescape(html.split("'")[1]))
+
+    assert parse_qs(url.query) == {
+        "teams__pk": [str(teams[0].pk)],
+        "name__startswith": ["Active"],
+    }
+    assert label(html) == "1 active"
+
+
+@pytest.mark.django_db
+def test_resolves_filtered_anchors_in_batch(
+    team_admin, teams, django_assert_num_queries
+):
+    with django_assert_num_queries(3):
+        rendered = render_anchors(
+            team_admin, teams, ["members_link", "active_members_link", "retired_link"]
+        )
+
+    assert [
+        {name: label(html) for name, html in anchors.items()} for anchors in rendered
+    ] == [
+        {"members_link": "1 members", "active_members_link": "1 active"}
+        | {"retired_link": "-"},
+        {"members_link": "3 members", "active_members_link": "2 active"}
+        | {"retired_link": "Retired"},
+        {"members_link": "5 members", "active_members_link": "3 active"}
+        | {"retired_link": "Retired"},
+    ]
+
+
+@pytest.mark.django_db
+def test_changelist_counts_filters_per_page(rf, admin_user, team_admin, teams):
+    request = rf.get("/admin/gaming/team/")
+    request.user = admin_user
+
+    with CaptureQueriesContext(connection) as context:
+        response = team_admin.changelist_view(request)
+        response.render()
+
+    grouped_queries = [
+        query["sql"]
+        for query in context.captured_queries
+        if "GROUP BY" in query["sql"]
+        and "anchor_active_members_link_count" in query["sql"]
+    ]
+    assert len(grouped_queries) == 1
+    assert "2 active" in response.content.decode()
+
+    changelist_queryset = response.context_data["cl"].queryset
+    assert "anchor_members_link_count" in changelist_queryset.query.annotations
+    assert (
+        "anchor_active_members_link_count" not in changelist_queryset.query.annotations
+    )
+
+
+@pytest.mark.django_db
+def test_queries_filtered_counts_per_row(teams):
+    team_admin = PlainTeamAdmin(Team, admin.site)
+
+    assert label(team_admin.active_members_link(teams[0])) == "1 active"
+    assert label(team_admin.active_members_link(teams[2])) == "1+ active"
+
+
+@pytest.mark.django_db
+def test_resolves_capped_filtered_counts_in_batch(teams, django_assert_num_queries):
+    team_admin = PlainTeamAdmin(Team, admin.site)
+
+    with django_assert_num_queries(1):
+        rendered = render_anchors(team_admin, teams, ["active_members_link"])
+
+    assert [label(anchors["active_members_link"]) for anchors in rendered] == [
+        "1 active",
+        "1+ active",
+        "1+ active",
+    ]
+
+
+def test_filter_requires_to_many_relation():
+    anchor = Anchor("captain", lambda self, instance: "", filter={"pk": 1})
+
+    with pytest.raises(ImproperlyConfigured, match="to-many"):
+        anchor.compile(Team)
+
+
+def test_filter_cannot_use_counter_field():
+    anchor = Anchor(
+        "members",
+        lambda self, instance, count: "",
+        filter={"pk": 1},
+        count_field="members_count",
+    )
+
+    with pytest.raises(ImproperlyConfigured, match="counter field"):
+        anchor.compile(Team)
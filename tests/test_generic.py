@@ -0,0 +1,134 @@
+import pytest
+from django.contrib import admin
+from django.contrib.auth.models import Permission
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from admin_anchors import admin_anchor, render_anchors
+from tests.project.gaming.admin import CommentAdmin
+from tests.project.gaming.models import Comment, Player, Team
+
+
+@pytest.fixture
+def comment_admin():
+    return CommentAdmin(Comment, admin.site)
+
+
+def create_comments(count):
+    comments = []
+
+    for index in range(count):
+        player = Player.objects.create(name=f"Player {index}")
+        team = Team.objects.create(name=f"Team {index}")
+        comments.append(Comment.objects.create(text="On player", content_object=player))
+        comments.append(Comment.objects.create(text="On team", content_object=team))
+
+    return comments
+
+
+def render_changelist(model_admin, rf, user):
+    request = rf.get("/admin/gaming/comment/")
+    request.user = user
+
+    with CaptureQueriesContext(connection) as context:
+        response = model_admin.changelist_view(request)
+        content = response.render().content.decode()
+
+    return content, len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_generic_anchors_link_to_the_target_models_admin(comment_admin):
+    player_comment, team_comment = create_comments(1)
+
+    assert comment_admin.content_object_link(player_comment) == (
+        f"<a href='/admin/gaming/player/{player_comment.object_id}/change/'>"
+        "Player 0</a>"
+    )
+    assert comment_admin.content_object_link(team_comment) == (
+        f"<a href='/admin/gaming/team/{team_comment.object_id}/change/'>Team 0</a>"
+    )
+
+
+@pytest.mark.django_db
+def test_generic_anchors_link_to_filtered_changelists():
+    @admin_anchor("content_object")
+    def content_object_link(self, instance):
+        return "Object"
+
+    player_comment, _ = create_comments(1)
+    link = content_object_link.anchor.get_link(None, player_comment)
+
+    assert link.url == f"/admin/gaming/player/?pk={player_comment.object_id}"
+
+
+@pytest.mark.django_db
+def test_empty_generic_relations_render_the_empty_value(comment_admin):
+    comment = Comment.objects.create(text="Dangling")
+
+    assert comment_admin.content_object_link(comment) == "-"
+
+
+@pytest.mark.django_db
+def test_generic_targets_are_fetched_once_per_content_type(
+    comment_admin, rf, admin_user
+):
+    create_comments(2)
+    content, few_rows_queries = render_changelist(comment_admin, rf, admin_user)
+
+    create_comments(8)
+    _, many_rows_queries = render_changelist(comment_admin, rf, admin_user)
+
+    assert "/admin/gaming/team/" in content
+    assert "/admin/gaming/player/" in content
+    assert few_rows_queries == many_rows_queries
+
+
+@pytest.mark.django_db
+def test_generic_anchors_check_permissions_per_target_model(
+    comment_admin, rf, django_user_model
+):
+    create_comments(1)
+    user = django_user_model.objects.create_user("viewer", is_staff=True)
+    user.user_permissions.add(
+        *Permission.objects.filter(codename__in=["view_comment", "view_team"])
+    )
+
+    content, _ = render_changelist(comment_admin, rf, user)
+
+    assert "/admin/gaming/team/" in content
+    assert "/admin/gaming/player/" not in content
+    assert "Player 0" in content
+
+
+@pytest.mark.django_db
+def test_generic_anchors_are_rendered_in_bulk(comment_admin):
+    create_comments(2)
+    rows = render_anchors(
+        comment_admin,
+        Comment.objects.prefetch_related("content_object").order_by("pk"),
+        ["content_object_link"],
+    )
+
+    assert [row["content_object_link"].split("/")[3] for row in rows] == [
+        "player",
+        "team",
+        "player",
+        "team",
+    ]
+
+
+def test_generic_foreign_keys_must_be_the_only_field_of_a_path():
+    @admin_anchor("content_object.name")
+    def name_link(self, instance):
+        return ""
+
+    @admin_anchor("content_object", sortable=True)
+    def sortable_link(self, instance):
+        return ""
+
+    with pytest.raises(ImproperlyConfigured):
+        name_link.anchor.compile(Comment)
+    with pytest.raises(ImproperlyConfigured):
+        sortable_link.anchor.compile(Comment)
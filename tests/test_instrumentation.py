@@ -0,0 +1,129 @@
+import logging
+
+import pytest
+from django.contrib import admin
+
+from admin_anchors import AdminAnchorsMixin, admin_anchor, render_anchors
+from admin_anchors.instrumentation import collect_anchor_stats
+from admin_anchors.signals import anchor_stats_collected
+from tests.project.gaming.models import Team
+
+
+class TeamAdmin(admin.ModelAdmin):
+    @admin_anchor("captain.profile")
+    def captains_profile_link(self, instance):
+        return "Profile"
+
+    @admin_anchor("members", count=True)
+    def members_link(self, instance, count):
+        return f"{count} members"
+
+
+@pytest.fixture
+def team_admin():
+    return TeamAdmin(Team, admin.site)
+
+
+@pytest.fixture
+def teams(create_teams):
+    create_teams(3)
+    return list(Team.objects.all())
+
+
+@pytest.mark.django_db
+def test_collects_per_anchor_stats(team_admin, teams):
+    with collect_anchor_stats() as collector:
+        for team in teams:
+            team_admin.captains_profile_link(team)
+            team_admin.members_link(team)
+        team_admin.captains_profile_link(Team(name="Without captain"))
+
+    profile_stats = collector.stats[team_admin.captains_profile_link.anchor]
+    members_stats = collector.stats[team_admin.members_link.anchor]
+
+    assert profile_stats.cells == 4
+    assert profile_stats.queries == 6
+    assert profile_stats.resolve_time > 0
+    assert profile_stats.label_time > 0
+    assert profile_stats.html_time > 0
+    assert members_stats.cells == 3
+    assert members_stats.queries == 3
+    assert str(members_stats).startswith(
+        "<Anchor TeamAdmin.members_link 'members'>: 3 cells, 3 queries"
+    )
+
+
+@pytest.mark.django_db
+def test_attributes_batch_queries_to_anchors(team_admin, teams):
+    with collect_anchor_stats() as collector:
+        render_anchors(team_admin, teams, ["captains_profile_link", "members_link"])
+
+    assert collector.stats[team_admin.captains_profile_link.anchor].queries == 1
+    assert collector.stats[team_admin.members_link.anchor].queries == 1
+
+
+@pytest.mark.django_db
+def test_attributes_changelist_batch_queries_to_anchors(rf, admin_user, teams):
+    class PageTeamAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+        list_display = ["name", "captains_profile_link", "active_members_link"]
+
+        @admin_anchor("captain.profile", pk_only=True)
+        def captains_profile_link(self, instance):
+            return "Profile"
+
+        @admin_anchor("members", count=True, filter={"name__startswith": "Captain"})
+        def active_members_link(self, instance, count):
+            return f"{count} active"
+
+    model_admin = PageTeamAdmin(Team, admin.site)
+    request = rf.get("/admin/gaming/team/")
+    request.user = admin_user
+
+    with collect_anchor_stats() as collector:
+        model_admin.changelist_view(request).render()
+
+    assert collector.stats[model_admin.captains_profile_link.anchor].queries == 1
+    assert collector.stats[model_admin.active_members_link.anchor].queries == 1
+
+
+@pytest.mark.django_db
+def test_does_not_collect_outside_of_collection(team_admin, teams):
+    with collect_anchor_stats() as collector:
+        pass
+
+    team_admin.members_link(teams[0])
+
+    assert collector.stats == {}
+
+
+@pytest.mark.django_db
+def test_sends_collected_stats(team_admin, teams):
+    received = []
+
+    def receiver(sender, collector, **kwargs):
+        received.append(collector)
+
+    anchor_stats_collected.connect(receiver)
+    try:
+        with collect_anchor_stats() as collector:
+            team_admin.members_link(teams[0])
+    finally:
+        anchor_stats_collected.disconnect(receiver)
+
+    assert received == [collector]
+
+
+@pytest.mark.django_db
+def test_middleware_logs_a_summary(admin_client, settings, teams, caplog):
+    settings.MIDDLEWARE = [
+        *settings.MIDDLEWARE,
+        "admin_anchors.middleware.AnchorStatsMiddleware",
+    ]
+
+    with caplog.at_level(logging.INFO, logger="admin_anchors"):
+        admin_client.get("/admin/gaming/team/")
+        admin_client.get("/admin/")
+
+    [record] = caplog.records
+    assert record.getMessage().startswith("Admin anchors of GET /admin/gaming/team/:")
+    assert "<Anchor TeamAdmin.members_link 'members'>: 3 cells" in record.getMessage()
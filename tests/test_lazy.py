@@ -0,0 +1,182 @@
+import json
+
+import pytest
+from django.contrib import admin
+from django.core.exceptions import PermissionDenied
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from admin_anchors import AdminAnchorsMixin, admin_anchor
+from tests.project.gaming.models import Team
+
+
+class LazyTeamAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+    list_display = ["__str__", "captain_link", "members_link"]
+
+    @admin_anchor("captain")
+    def captain_link(self, instance):
+        return str(instance.captain)
+
+    @admin_anchor("members", count=True, lazy=True)
+    def members_link(self, instance, count):
+        return f"{count} members"
+
+
+@pytest.fixture
+def team_admin():
+    return LazyTeamAdmin(Team, admin.site)
+
+
+def get_lazy_anchors(model_admin, rf, admin_user, query):
+    request = rf.get("/admin/gaming/team/anchors/", query)
+    request.user = admin_user
+    return model_admin.anchors_view(request)
+
+
+@pytest.mark.django_db
+def test_lazy_anchors_render_placeholders_without_queries(
+    team_admin, django_assert_num_queries, create_team
+):
+    team = create_team("Team", 2)
+
+    with django_assert_num_queries(0):
+        placeholder = team_admin.members_link(team)
+
+    assert placeholder == (
+        "<span data-admin-anchor='members_link' "
+        "data-admin-anchor-url='/admin/gaming/team/anchors/' "
+        f"data-object-id='{team.pk}'>…</span>"
+    )
+
+
+@pytest.mark.django_db
+def test_lazy_anchors_are_excluded_from_the_changelist_queryset(team_admin, rf):
+    queryset = team_admin.get_queryset(rf.get("/"))
+
+    assert queryset.query.select_related == {"captain": {}}
+    assert "anchor_members_link_count" not in queryset.query.annotations
+
+
+def test_lazy_anchors_add_the_loader_script(team_admin):
+    assert "admin_anchors/lazy_anchors.js" in str(team_admin.media)
+
+
+def test_eager_anchors_do_not_add_the_loader_script():
+    class EagerTeamAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+        @admin_anchor("captain")
+        def captain_link(self, instance):
+            return "Captain"
+
+    assert "lazy_anchors.js" not in str(EagerTeamAdmin(Team, admin.site).media)
+
+
+@pytest.mark.django_db
+def test_lazy_anchors_are_rendered_in_one_batch(
+    team_admin, rf, admin_user, django_assert_num_queries, create_team
+):
+    teams = [create_team(f"Team {index}", index) for index in range(3)]
+
+    with django_assert_num_queries(1):
+        response = get_lazy_anchors(
+            team_admin,
+            rf,
+            admin_user,
+            {"anchor": "members_link", "pk": [team.pk for team in teams]},
+        )
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        str(team.pk): (
+            f"<a href='/admin/gaming/player/?teams__pk={team.pk}'>{index} members</a>"
+        )
+        for index, team in enumerate(teams)
+    }
+
+
+@pytest.mark.django_db
+def test_lazy_anchors_skip_the_eager_anchors(rf, admin_user, create_team):
+    class MixedTeamAdmin(LazyTeamAdmin):
+        list_display = [*LazyTeamAdmin.list_display, "led_teams_link", "players_link"]
+
+        @admin_anchor("captain.led_teams", count=True)
+        def led_teams_link(self, instance, count):
+            return f"{count} led teams"
+
+        @admin_anchor("members")
+        def players_link(self, instance):
+            return ", ".join(str(member) for member in instance.members.all())
+
+    team = create_team("Team", 2)
+
+    with CaptureQueriesContext(connection) as context:
+        response = get_lazy_anchors(
+            MixedTeamAdmin(Team, admin.site),
+            rf,
+            admin_user,
+            {"anchor": "members_link", "pk": [team.pk]},
+        )
+
+    [query] = context.captured_queries
+    assert query["sql"].count("COUNT(") == 1
+    assert '"gaming_player"."name"' not in query["sql"]
+    assert json.loads(response.content) == {
+        str(
+            team.pk
+        ): f"<a href='/admin/gaming/player/?teams__pk={team.pk}'>2 members</a>"
+    }
+
+
+@pytest.mark.django_db
+def test_lazy_anchors_respect_the_admins_queryset(rf, admin_user, create_team):
+    class ScopedTeamAdmin(LazyTeamAdmin):
+        def get_queryset(self, request):
+            return super().get_queryset(request).filter(name="Visible")
+
+    visible = create_team("Visible", 1)
+    hidden = create_team("Hidden", 2)
+
+    response = get_lazy_anchors(
+        ScopedTeamAdmin(Team, admin.site),
+        rf,
+        admin_user,
+        {"anchor": "members_link", "pk": [visible.pk, hidden.pk]},
+    )
+
+    assert json.loads(response.content) == {
+        str(visible.pk): (
+            f"<a href='/admin/gaming/player/?teams__pk={visible.pk}'>1 members</a>"
+        )
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "query",
+    [
+        {"anchor": "captain_link", "pk": ["1"]},
+        {"anchor": "missing", "pk": ["1"]},
+        {"anchor": "members_link", "pk": ["not-a-pk"]},
+    ],
+)
+def test_lazy_anchors_reject_invalid_requests(team_admin, rf, admin_user, query):
+    response = get_lazy_anchors(team_admin, rf, admin_user, query)
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_lazy_anchors_require_view_permission(team_admin, rf, django_user_model):
+    request = rf.get("/admin/gaming/team/anchors/", {"anchor": "members_link"})
+    request.user = django_user_model.objects.create_user("staff", is_staff=True)
+
+    with pytest.raises(PermissionDenied):
+        team_admin.anchors_view(request)
+
+
+@pytest.mark.django_db
+def test_lazy_anchors_endpoint_is_routed(admin_client):
+    response = admin_client.get(
+        "/admin/gaming/team/anchors/", {"anchor": "members_link"}
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,206 @@
+import pytest
+from django.contrib import admin
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from admin_anchors import AdminAnchorsMixin, admin_anchor
+from tests.project.gaming.admin import PlayerAdmin, ProfileAdmin, TeamAdmin
+from tests.project.gaming.models import Player, Profile, Team
+
+
+def count_changelist_queries(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_team_queryset_is_extended_with_anchor_lookups(rf):
+    queryset = TeamAdmin(Team, admin.site).get_queryset(rf.get("/"))
+
+    assert queryset.query.select_related == {"captain": {"profile": {}}}
+    assert queryset._prefetch_related_lookups == ()
+    assert "anchor_members_link_count" in queryset.query.annotations
+
+
+@pytest.mark.django_db
+def test_profile_queryset_is_extended_with_anchor_lookups(rf):
+    queryset = ProfileAdmin(Profile, admin.site).get_queryset(rf.get("/"))
+
+    assert queryset.query.select_related == {"player": {}}
+    assert "anchor_player_teams_link_count" in queryset.query.annotations
+
+
+@pytest.mark.django_db
+def test_uncounted_to_many_anchors_are_prefetched(rf):
+    class TeamMembersAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+        list_display = ["members_link"]
+
+        @admin_anchor("members")
+        def members_link(self, instance):
+            return f"{instance.members.count()} members"
+
+    queryset = TeamMembersAdmin(Team, admin.site).get_queryset(rf.get("/"))
+
+    assert queryset._prefetch_related_lookups == ("members",)
+    assert not queryset.query.annotations
+
+
+@pytest.mark.django_db
+def test_annotated_counts_are_passed_to_labels(
+    rf, django_assert_num_queries, create_teams
+):
+    create_teams(3)
+    empty_team = Team.objects.create(name="Empty")
+    model_admin = TeamAdmin(Team, admin.site)
+
+    with django_assert_num_queries(1):
+        teams = list(model_admin.get_queryset(rf.get("/")).order_by("pk"))
+
+    with django_assert_num_queries(0):
+        labels = [model_admin.members_link(team) for team in teams]
+
+    assert labels[:3] == [
+        f"<a href='/admin/gaming/player/?teams__pk={team.pk}'>2 members</a>"
+        for team in teams[:3]
+    ]
+    assert labels[3] == (
+        f"<a href='/admin/gaming/player/?teams__pk={empty_team.pk}'>0 members</a>"
+    )
+
+
+@pytest.mark.django_db
+def test_combined_to_many_counts_are_not_multiplied(rf):
+    captain = Player.objects.create(name="Captain")
+    for index in range(3):
+        team = Team.objects.create(name=f"Team {index}", captain=captain)
+        team.members.add(captain)
+
+    model_admin = PlayerAdmin(Player, admin.site)
+    player = model_admin.get_queryset(rf.get("/")).get(pk=captain.pk)
+
+    assert player.anchor_teams_link_count == 3
+    assert player.anchor_led_teams_link_count == 3
+
+
+@pytest.mark.django_db
+def test_readonly_field_anchors_are_collected(rf):
+    class ProfileOnlyAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+        readonly_fields = ["profile_link"]
+
+        @admin_anchor("profile")
+        def profile_link(self, instance):
+            return "Profile"
+
+    model_admin = ProfileOnlyAdmin(Player, admin.site)
+
+    assert model_admin.get_anchors(rf.get("/")) == [model_admin.profile_link.anchor]
+    assert model_admin.get_queryset(rf.get("/")).query.select_related == {"profile": {}}
+
+
+def test_non_anchor_list_display_items_are_ignored(rf):
+    def plain_callable(instance):
+        return ""
+
+    class PlainAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+        list_display = ["__str__", "name", plain_callable]
+
+    model_admin = PlainAdmin(Player, admin.site)
+
+    assert model_admin.get_anchors(rf.get("/")) == []
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url", ["/admin/gaming/player/", "/admin/gaming/profile/", "/admin/gaming/team/"]
+)
+def test_changelist_query_count_does_not_grow_with_rows(
+    admin_client, url, create_teams
+):
+    create_teams(2)
+    few_rows_queries = count_changelist_queries(admin_client, url)
+
+    create_teams(8)
+    many_rows_queries = count_changelist_queries(admin_client, url)
+
+    assert few_rows_queries == many_rows_queries
+
+
+@pytest.mark.django_db
+def test_empty_to_many_anchors_are_hidden_without_extra_queries(
+    rf, django_assert_num_queries, create_teams
+):
+    class TeamMembersAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+        list_display = ["members_link", "members_count_link"]
+
+        @admin_anchor("members", pk_only=True, hide_empty=True)
+        def members_link(self, instance):
+            return "Members"
+
+        @admin_anchor("members", count=True, hide_empty=True)
+        def members_count_link(self, instance, count):
+            return f"{count} members"
+
+    create_teams(1)
+    empty_team = Team.objects.create(name="Empty")
+    model_admin = TeamMembersAdmin(Team, admin.site)
+    queryset = model_admin.get_queryset(rf.get("/"))
+
+    assert "anchor_members_link_exists" in queryset.query.annotations
+    assert "anchor_members_count_link_exists" not in queryset.query.annotations
+
+    with django_assert_num_queries(1):
+        team, empty_team = queryset.order_by("pk")
+        assert model_admin.members_link(team).endswith(">Members</a>")
+        assert model_admin.members_count_link(team).endswith(">2 members</a>")
+        assert model_admin.members_link(empty_team) == "-"
+        assert model_admin.members_count_link(empty_team) == "-"
+
+
+class PkOnlyTeamAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+    list_display = ["__str__", "captain_link", "captains_profile_link"]
+    readonly_fields = ["captains_profile_link"]
+
+    @admin_anchor("captain", pk_only=True)
+    def captain_link(self, instance):
+        return "Captain"
+
+    @admin_anchor("captain.profile", pk_only=True)
+    def captains_profile_link(self, instance):
+        return "Captains profile"
+
+
+def render_admin_view(view, request, *args):
+    with CaptureQueriesContext(connection) as context:
+        response = view(request, *args)
+        response.render()
+    return response.content.decode(), len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_pk_only_anchors_are_resolved_once_per_page(rf, admin_user, create_teams):
+    model_admin = PkOnlyTeamAdmin(Team, admin.site)
+    request = rf.get("/admin/gaming/team/")
+    request.user = admin_user
+
+    create_teams(2)
+    _, few_rows_queries = render_admin_view(model_admin.changelist_view, request)
+
+    create_teams(8)
+    _, many_rows_queries = render_admin_view(model_admin.changelist_view, request)
+
+    assert few_rows_queries == many_rows_queries
+
+
+@pytest.mark.django_db
+def test_pk_only_anchors_are_resolved_on_the_change_page(rf, admin_user, create_teams):
+    model_admin = PkOnlyTeamAdmin(Team, admin.site)
+    create_teams(1)
+    team = Team.objects.get()
+    request = rf.get(f"/admin/gaming/team/{team.pk}/change/")
+    request.user = admin_user
+
+    content, _ = render_admin_view(model_admin.change_view, request, str(team.pk))
+
+    assert f"/admin/gaming/profile/?pk={team.captain.profile.pk}" in content
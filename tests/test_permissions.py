@@ -0,0 +1,124 @@
+import json
+
+import pytest
+from django.contrib import admin
+from django.contrib.auth.models import Permission
+
+from admin_anchors import AdminAnchorsMixin, admin_anchor
+from tests.project.gaming.admin import PlayerAdmin
+from tests.project.gaming.models import Team
+
+
+class TeamAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+    list_display = ["name", "captain_link", "members_link", "lazy_members_link"]
+
+    @admin_anchor("captain", pk_only=True)
+    def captain_link(self, instance):
+        return f"<{instance.name} captain>"
+
+    @admin_anchor("members", count=True)
+    def members_link(self, instance, count):
+        return f"{count} members"
+
+    @admin_anchor("members", count=True, lazy=True)
+    def lazy_members_link(self, instance, count):
+        return f"{count} lazy members"
+
+
+@pytest.fixture
+def team_admin():
+    return TeamAdmin(Team, admin.site)
+
+
+@pytest.fixture
+def team_viewer(django_user_model):
+    user = django_user_model.objects.create_user("viewer", is_staff=True)
+    user.user_permissions.add(Permission.objects.get(codename="view_team"))
+    return user
+
+
+@pytest.fixture
+def teams(create_teams):
+    return create_teams(3, member_count=1)
+
+
+def render_changelist(model_admin, rf, user):
+    request = rf.get("/admin/gaming/team/")
+    request.user = user
+    response = model_admin.changelist_view(request)
+    return response.render().content.decode()
+
+
+@pytest.mark.django_db
+def test_anchors_render_plain_labels_without_view_permission(
+    team_admin, rf, team_viewer, teams
+):
+    content = render_changelist(team_admin, rf, team_viewer)
+
+    assert "/admin/gaming/player/" not in content
+    assert "&lt;Team 0 captain&gt;" in content
+    assert "1 members" in content
+
+
+@pytest.mark.django_db
+def test_anchors_link_with_view_permission(team_admin, rf, team_viewer, teams):
+    team_viewer.user_permissions.add(Permission.objects.get(codename="view_player"))
+
+    content = render_changelist(team_admin, rf, team_viewer)
+
+    assert f"/admin/gaming/player/?pk={teams[0].captain.pk}" in content
+    assert f"/admin/gaming/player/?teams__pk={teams[0].pk}" in content
+
+
+@pytest.mark.django_db
+def test_permissions_are_checked_once_per_request(
+    team_admin, rf, admin_user, teams, monkeypatch
+):
+    calls = []
+
+    def has_view_or_change_permission(self, request, obj=None):
+        calls.append(request)
+        return True
+
+    monkeypatch.setattr(
+        PlayerAdmin, "has_view_or_change_permission", has_view_or_change_permission
+    )
+
+    render_changelist(team_admin, rf, admin_user)
+
+    assert len(calls) == 1
+
+
+@pytest.mark.django_db
+def test_lazy_anchors_render_plain_labels_without_view_permission(
+    team_admin, rf, team_viewer, teams
+):
+    request = rf.get(
+        "/admin/gaming/team/anchors/",
+        {"anchor": "lazy_members_link", "pk": [teams[0].pk]},
+    )
+    request.user = team_viewer
+
+    response = team_admin.anchors_view(request)
+
+    assert json.loads(response.content) == {str(teams[0].pk): "1 lazy members"}
+
+
+@pytest.mark.django_db
+def test_anchors_to_unregistered_models_render_plain_labels(rf, admin_user, teams):
+    class CaptainAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+        list_display = ["name", "captain_link"]
+
+        @admin_anchor("captain")
+        def captain_link(self, instance):
+            return "Captain"
+
+    site = admin.AdminSite(name="captains")
+    site.register(Team, CaptainAdmin)
+    request = rf.get("/")
+    request.user = admin_user
+    model_admin = site._registry[Team]
+
+    assert not model_admin.has_anchor_permission(
+        request, model_admin.captain_link.anchor
+    )
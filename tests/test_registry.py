@@ -0,0 +1,159 @@
+from io import StringIO
+
+import pytest
+from django.contrib import admin
+from django.core.management import call_command
+
+from admin_anchors import admin_anchor
+from admin_anchors.management.commands.inspect_anchors import (
+    find_scans,
+    get_filter_field,
+    get_relation_kind,
+    is_indexed,
+)
+from admin_anchors.registry import get_anchors, iter_admin_anchors
+from tests.project.gaming.admin import PlayerAdmin, TeamAdmin
+from tests.project.gaming.models import Player, Profile, Team
+
+
+def inspect_anchors(*args):
+    stdout = StringIO()
+    call_command("inspect_anchors", *args, stdout=stdout)
+    return stdout.getvalue()
+
+
+def test_applied_anchors_are_registered():
+    @admin_anchor("captain")
+    def captain_link(self, instance):
+        return "Captain"
+
+    assert captain_link.anchor in get_anchors()
+    assert TeamAdmin.members_link.anchor in get_anchors()
+
+
+def test_registered_admins_anchors_are_listed():
+    anchors = {
+        (type(registered.model_admin), registered.name)
+        for registered in iter_admin_anchors()
+    }
+
+    assert (TeamAdmin, "members_link") in anchors
+    assert (PlayerAdmin, "profile_link") in anchors
+
+
+@pytest.mark.parametrize(
+    "model, field_path, kind",
+    [
+        (Team, "captain", "foreign key"),
+        (Profile, "player", "one-to-one"),
+        (Player, "profile", "reverse one-to-one"),
+        (Player, "led_teams", "reverse foreign key"),
+        (Team, "members", "many-to-many"),
+        (Player, "teams", "many-to-many"),
+    ],
+)
+def test_relation_kinds_and_filter_fields_are_indexed(model, field_path, kind):
+    @admin_anchor(field_path)
+    def anchor_link(self, instance):
+        return ""
+
+    path = anchor_link.anchor.compile(model)
+
+    assert get_relation_kind(path) == kind
+    assert is_indexed(get_filter_field(path))
+
+
+def test_unindexed_fields_are_detected():
+    assert not is_indexed(Team._meta.get_field("name"))
+
+
+@pytest.mark.parametrize(
+    "plan, scans",
+    [
+        ("SCAN gaming_team", ["SCAN gaming_team"]),
+        ("SCAN gaming_team USING COVERING INDEX idx", []),
+        ("SEARCH gaming_team USING INTEGER PRIMARY KEY (rowid=?)", []),
+        ("Seq Scan on gaming_team  (cost=0.00..1.01)", ["Seq Scan on gaming_team"]),
+        ("Index Scan using gaming_team_pkey on gaming_team", []),
+    ],
+)
+def test_sequential_scans_are_found(plan, scans):
+    assert [scan.split("  ")[0] for scan in find_scans(plan)] == scans
+
+
+@pytest.mark.django_db
+def test_command_lists_anchors_without_explaining():
+    output = inspect_anchors("--no-explain")
+
+    assert "admin: TeamAdmin.members_link (gaming.Team)" in output
+    assert "  path: members (many-to-many) -> gaming.Player" in output
+    assert "  filter: teams__pk=<gaming.Team>" in output
+    assert "explain" not in output
+
+
+@pytest.mark.django_db
+def test_command_skips_explaining_without_rows():
+    assert "explain: skipped, no rows to sample" in inspect_anchors()
+
+
+@pytest.mark.django_db
+def test_command_explains_anchor_queries(create_team):
+    create_team()
+
+    output = inspect_anchors()
+
+    assert "  changelist: " in output
+    assert "  counts: " in output
+    assert "  values: " in output
+
+
+@pytest.mark.django_db
+def test_command_warns_about_unindexed_filters_and_scans(monkeypatch):
+    class NameAdmin(admin.ModelAdmin):
+        @admin_anchor("led_teams", hide_empty=True)
+        def led_teams_link(self, instance):
+            return "Led teams"
+
+    site = admin.AdminSite(name="inspection")
+    site.register(Player, NameAdmin)
+    monkeypatch.setattr(
+        "admin_anchors.management.commands.inspect_anchors.is_indexed",
+        lambda field: False,
+    )
+    monkeypatch.setattr(
+        "admin_anchors.management.commands.inspect_anchors.find_scans",
+        lambda plan: ["SCAN gaming_team"],
+    )
+    captain = Player.objects.create(name="Captain")
+    Team.objects.create(name="Team", captain=captain)
+
+    output = inspect_anchors()
+
+    assert "inspection: " in output
+    assert ".NameAdmin.led_teams_link (gaming.Player)" in output
+    assert "  warning: no index on gaming_team.captain_id" in output
+    assert "  warning: exists query scans: SCAN gaming_team" in output
+
+
+def test_command_reports_invalid_paths():
+    class InvalidAdmin(admin.ModelAdmin):
+        @admin_anchor("name")
+        def name_link(self, instance):
+            return ""
+
+    site = admin.AdminSite(name="invalid")
+    site.register(Player, InvalidAdmin)
+
+    output = inspect_anchors("--no-explain")
+
+    assert ".InvalidAdmin.name_link (gaming.Player)\n  path: name\n  error:" in output
+
+
+def test_command_lists_anchors_without_admin():
+    @admin_anchor("captain")
+    def orphan_link(self, instance):
+        return "Captain"
+
+    output = inspect_anchors("--no-explain")
+
+    assert "orphan_link\n  path: captain\n  not used by a registered" in output
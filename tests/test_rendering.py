@@ -0,0 +1,162 @@
+import pytest
+from django.contrib import admin
+from django.core.exceptions import ImproperlyConfigured
+
+from admin_anchors import admin_anchor, iter_render_anchors, render_anchors
+from admin_anchors.rendering import iter_anchor_links
+from tests.project.gaming.models import Team
+
+
+class TeamAdmin(admin.ModelAdmin):
+    @admin_anchor("captain", pk_only=True)
+    def captain_link(self, instance):
+        return "Captain"
+
+    @admin_anchor("captain.profile", pk_only=True)
+    def captains_profile_link(self, instance):
+        return "Profile"
+
+    @admin_anchor("members", count=True)
+    def members_link(self, instance, count):
+        return f"{count} members"
+
+    @admin_anchor("captain.led_teams", hide_empty=True)
+    def captains_teams_link(self, instance):
+        return "Captains teams"
+
+
+ANCHOR_NAMES = [
+    "captain_link",
+    "captains_profile_link",
+    "members_link",
+    "captains_teams_link",
+]
+
+
+@pytest.fixture
+def team_admin():
+    return TeamAdmin(Team, admin.site)
+
+
+@pytest.mark.django_db
+def test_renders_anchors_of_many_instances(
+    team_admin, django_assert_num_queries, create_teams
+):
+    create_teams(3)
+    Team.objects.create(name="Empty")
+    teams = list(Team.objects.order_by("pk"))
+
+    with django_assert_num_queries(5):
+        rendered = render_anchors(team_admin, teams, ANCHOR_NAMES)
+
+    team = teams[0]
+    assert rendered[0] == {
+        "captain_link": (
+            f"<a href='/admin/gaming/player/?pk={team.captain_id}'>Captain</a>"
+        ),
+        "captains_profile_link": (
+            f"<a href='/admin/gaming/profile/?pk={team.captain.profile.pk}'>Profile</a>"
+        ),
+        "members_link": (
+            f"<a href='/admin/gaming/player/?teams__pk={team.pk}'>2 members</a>"
+        ),
+        "captains_teams_link": (
+            f"<a href='/admin/gaming/team/?captain__pk={team.captain_id}'>"
+            "Captains teams</a>"
+        ),
+    }
+    assert rendered[3] == {
+        "captain_link": "-",
+        "captains_profile_link": "-",
+        "members_link": (
+            f"<a href='/admin/gaming/player/?teams__pk={teams[3].pk}'>0 members</a>"
+        ),
+        "captains_teams_link": "-",
+    }
+
+
+@pytest.mark.django_db
+def test_query_count_does_not_grow_with_instances(
+    team_admin, django_assert_num_queries, create_teams
+):
+    create_teams(20)
+
+    with django_assert_num_queries(6):
+        render_anchors(team_admin, Team.objects.all(), ANCHOR_NAMES)
+
+
+@pytest.mark.django_db
+def test_streams_instances_in_chunks(
+    team_admin, django_assert_num_queries, create_teams
+):
+    create_teams(5)
+
+    with django_assert_num_queries(1 + 3 * 5):
+        rendered = list(
+            iter_render_anchors(
+                team_admin, Team.objects.order_by("pk"), ANCHOR_NAMES, chunk_size=2
+            )
+        )
+
+    assert [team.name for team, _ in rendered] == [f"Team {i}" for i in range(5)]
+
+
+@pytest.mark.django_db
+def test_iterates_anchor_links(team_admin, create_teams):
+    create_teams(1)
+
+    [(team, links)] = iter_anchor_links(
+        team_admin, Team.objects.all(), ["members_link"]
+    )
+
+    assert links["members_link"].url == f"/admin/gaming/player/?teams__pk={team.pk}"
+    assert links["members_link"].label == "2 members"
+
+
+def test_rejects_non_anchor_names(team_admin):
+    with pytest.raises(ImproperlyConfigured):
+        render_anchors(team_admin, [], ["__str__"])
+
+
+def test_renders_nothing_for_no_instances(team_admin):
+    assert render_anchors(team_admin, [None], ANCHOR_NAMES) == [
+        dict.fromkeys(ANCHOR_NAMES, "-")
+    ]
+
+
+@pytest.mark.django_db
+def test_reuses_annotations(team_admin, django_assert_num_queries, create_teams):
+    create_teams(2)
+    annotations = {
+        **team_admin.members_link.anchor.get_annotations(Team),
+        **team_admin.captains_teams_link.anchor.get_annotations(Team),
+    }
+    teams = list(
+        Team.objects.annotate(**annotations).prefetch_related("captain__led_teams")
+    )
+
+    with django_assert_num_queries(1):
+        render_anchors(team_admin, teams, ["members_link", "captains_teams_link"])
+
+
+@pytest.mark.django_db
+def test_loads_related_objects_of_labels_in_batch(
+    django_assert_num_queries, create_teams
+):
+    class CaptainTeamAdmin(admin.ModelAdmin):
+        @admin_anchor("captain")
+        def captain_link(self, instance):
+            return str(instance.captain)
+
+    create_teams(5)
+    teams = list(Team.objects.order_by("pk"))
+
+    with django_assert_num_queries(1):
+        rendered = render_anchors(
+            CaptainTeamAdmin(Team, admin.site), teams, ["captain_link"]
+        )
+
+    assert [row["captain_link"] for row in rendered] == [
+        f"<a href='/admin/gaming/player/?pk={team.captain_id}'>{team.name} captain</a>"
+        for team in teams
+    ]
@@ -0,0 +1,102 @@
+import pytest
+from django.contrib import admin
+
+from admin_anchors import admin_anchor
+from admin_anchors.resolvers import resolve_anchor_values, resolve_shared_values
+from tests.project.gaming.models import Player, Profile, Team
+
+
+@admin_anchor("captain.profile", pk_only=True)
+def captains_profile_anchor(self, instance):
+    return "Profile"
+
+
+@admin_anchor("player.teams", pk_only=True)
+def player_teams_anchor(self, instance):
+    return "Teams"
+
+
+@admin_anchor("captain", pk_only=True)
+def captain_anchor(self, instance):
+    return "Captain"
+
+
+@pytest.mark.django_db
+def test_resolves_deep_paths_with_one_query(django_assert_num_queries):
+    team_admin = admin.ModelAdmin(Team, admin.site)
+    captain = Player.objects.create(name="Captain")
+    profile = Profile.objects.create(player=captain)
+    Team.objects.create(name="With profile", captain=captain)
+    Team.objects.create(name="Without profile", captain=Player.objects.create())
+    Team.objects.create(name="Without captain")
+    teams = list(Team.objects.order_by("pk"))
+
+    with django_assert_num_queries(1):
+        resolve_anchor_values(captains_profile_anchor.anchor, teams)
+
+    with django_assert_num_queries(0):
+        assert [captains_profile_anchor(team_admin, team) for team in teams] == [
+            f"<a href='/admin/gaming/profile/?pk={profile.pk}'>Profile</a>",
+            "-",
+            "-",
+        ]
+
+
+@pytest.mark.django_db
+def test_resolves_parent_pks_of_to_many_paths(django_assert_num_queries):
+    profile_admin = admin.ModelAdmin(Profile, admin.site)
+    Player.objects.create(name="Other")
+    player = Player.objects.create(name="John")
+    profiles = [Profile.objects.create(player=player), Profile.objects.create()]
+
+    with django_assert_num_queries(1):
+        resolve_anchor_values(player_teams_anchor.anchor, profiles)
+
+    with django_assert_num_queries(0):
+        assert [
+            player_teams_anchor(profile_admin, profile) for profile in profiles
+        ] == [
+            f"<a href='/admin/gaming/team/?members__pk={player.pk}'>Teams</a>",
+            "-",
+        ]
+
+
+@pytest.mark.django_db
+def test_skips_paths_without_hops(django_assert_num_queries):
+    teams = [Team.objects.create(name="Team")]
+
+    with django_assert_num_queries(0):
+        resolve_anchor_values(captain_anchor.anchor, teams)
+        resolve_anchor_values(captain_anchor.anchor, [None])
+
+
+@admin_anchor("captain.led_teams", pk_only=True)
+def captains_teams_anchor(self, instance):
+    return "Captains teams"
+
+
+@pytest.mark.django_db
+def test_resolves_shared_prefixes_with_one_query(django_assert_num_queries):
+    team_admin = admin.ModelAdmin(Team, admin.site)
+    captain = Player.objects.create(name="Captain")
+    profile = Profile.objects.create(player=captain)
+    Team.objects.create(name="With captain", captain=captain)
+    Team.objects.create(name="Without captain")
+    teams = list(Team.objects.order_by("pk"))
+    anchors = [captain_anchor, captains_profile_anchor, captains_teams_anchor]
+
+    with django_assert_num_queries(1) as context:
+        resolve_shared_values([anchor.anchor for anchor in anchors], teams)
+
+    assert context.captured_queries[0]["sql"].count('JOIN "gaming_player"') == 1
+
+    with django_assert_num_queries(0):
+        assert [[anchor(team_admin, team) for anchor in anchors] for team in teams] == [
+            [
+                f"<a href='/admin/gaming/player/?pk={captain.pk}'>Captain</a>",
+                f"<a href='/admin/gaming/profile/?pk={profile.pk}'>Profile</a>",
+                f"<a href='/admin/gaming/team/?captain__pk={captain.pk}'>"
+                "Captains teams</a>",
+            ],
+            ["-", "-", "-"],
+        ]
@@ -0,0 +1,141 @@
+import pytest
+from django.contrib import admin
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from admin_anchors import AdminAnchorsMixin, admin_anchor
+from admin_anchors.expressions import AnchorOrder
+from tests.project.gaming.models import Team
+
+
+class SortableTeamAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+    list_display = [
+        "name",
+        "captain_link",
+        "captains_profile_link",
+        "members_link",
+        "lazy_members_link",
+    ]
+
+    @admin_anchor("captain", pk_only=True, sortable=True)
+    def captain_link(self, instance):
+        return "Captain"
+
+    @admin_anchor("captain.profile", pk_only=True, sortable=True)
+    def captains_profile_link(self, instance):
+        return "Profile"
+
+    @admin_anchor("members", count=True, sortable=True)
+    def members_link(self, instance, count):
+        return f"{count} members"
+
+    @admin_anchor("members", lazy=True, sortable=True)
+    def lazy_members_link(self, instance):
+        return "Members"
+
+
+@pytest.fixture
+def team_admin():
+    return SortableTeamAdmin(Team, admin.site)
+
+
+def get_sorted_names(model_admin, rf, admin_user, ordering):
+    request = rf.get("/admin/gaming/team/", {"o": ordering})
+    request.user = admin_user
+
+    with CaptureQueriesContext(connection) as context:
+        response = model_admin.changelist_view(request)
+
+    results = response.context_data["cl"].result_list
+    return [team.name for team in results], context.captured_queries
+
+
+def test_sortable_anchors_set_admin_order_field(team_admin):
+    assert team_admin.captain_link.admin_order_field == AnchorOrder(
+        team_admin.captain_link.anchor
+    )
+    assert team_admin.members_link.admin_order_field == AnchorOrder(
+        team_admin.members_link.anchor
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "ordering, expected", [("-2", ["C", "A", "B"]), ("3", ["C", "B", "A"])]
+)
+def test_anchors_are_sortable_without_the_mixin(
+    rf, admin_user, ordering, expected, create_team
+):
+    class PlainTeamAdmin(admin.ModelAdmin):
+        list_display = ["name", "captain_link", "members_link"]
+
+        @admin_anchor("captain", sortable=True)
+        def captain_link(self, instance):
+            return "Captain"
+
+        @admin_anchor("members", count=True, sortable=True)
+        def members_link(self, instance, count):
+            return f"{count} members"
+
+    for name, member_count in [("B", 2), ("A", 3), ("C", 1)]:
+        create_team(name, member_count)
+
+    names, _ = get_sorted_names(
+        PlainTeamAdmin(Team, admin.site), rf, admin_user, ordering
+    )
+
+    assert names == expected
+
+
+@pytest.mark.django_db
+def test_count_anchors_are_sorted_by_their_count_annotation(
+    team_admin, rf, admin_user, create_team
+):
+    for name, member_count in [("B", 2), ("A", 3), ("C", 1)]:
+        create_team(name, member_count)
+
+    names, queries = get_sorted_names(team_admin, rf, admin_user, "-4")
+
+    assert names == ["A", "B", "C"]
+    results_query = next(q["sql"] for q in queries if "ORDER BY" in q["sql"])
+    assert results_query.count("COUNT(") == 1
+
+
+@pytest.mark.django_db
+def test_lazy_anchors_are_sorted_in_the_database(
+    team_admin, rf, admin_user, create_team
+):
+    for name, member_count in [("B", 2), ("A", 3), ("C", 1)]:
+        create_team(name, member_count)
+
+    names, _ = get_sorted_names(team_admin, rf, admin_user, "5")
+
+    assert names == ["C", "B", "A"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ordering", ["2", "3"])
+def test_single_object_anchors_are_sorted_by_related_pk(
+    team_admin, rf, admin_user, ordering, create_team
+):
+    for name in ["B", "A", "C"]:
+        create_team(name, 0)
+
+    names, _ = get_sorted_names(team_admin, rf, admin_user, f"-{ordering}")
+
+    assert names == ["C", "A", "B"]
+
+
+@pytest.mark.django_db
+def test_unsortable_anchors_do_not_add_order_annotations(rf):
+    class TeamAdmin(AdminAnchorsMixin, admin.ModelAdmin):
+        list_display = ["captain_link"]
+
+        @admin_anchor("captain")
+        def captain_link(self, instance):
+            return "Captain"
+
+    queryset = TeamAdmin(Team, admin.site).get_queryset(rf.get("/"))
+
+    assert not hasattr(TeamAdmin.captain_link, "admin_order_field")
+    assert not queryset.query.annotations
@@ -0,0 +1,37 @@
+import pytest
+from django.contrib import admin
+
+from admin_anchors.testing import QueryBudgetExceeded, query_budget
+from tests.project.gaming.admin import TeamAdmin
+from tests.project.gaming.models import Team
+
+
+def render_changelist(model_admin, rf, user):
+    request = rf.get("/admin/gaming/team/")
+    request.user = user
+    model_admin.changelist_view(request).render()
+
+
+@pytest.mark.django_db
+def test_passes_within_the_budget(rf, admin_user, create_teams):
+    create_teams(5)
+
+    with query_budget(10) as context:
+        render_changelist(TeamAdmin(Team, admin.site), rf, admin_user)
+
+    assert 0 < len(context) <= 10
+
+
+@pytest.mark.django_db
+def test_fails_when_exceeding_the_budget(rf, admin_user, create_teams):
+    class SlowTeamAdmin(admin.ModelAdmin):
+        list_display = ["__str__", "captain_name"]
+
+        def captain_name(self, instance):
+            return instance.captain.name
+
+    create_teams(5)
+
+    with pytest.raises(QueryBudgetExceeded, match="exceeding the budget of 5"):
+        with query_budget(5):
+            render_changelist(SlowTeamAdmin(Team, admin.site), rf, admin_user)
@@ -1,8 +1,25 @@
 import pytest
-
-from admin_anchors.utils import create_admin_anchor, resolve_instance_field_path
+from django.contrib import admin
+from django.test import override_settings
+from django.urls import path, set_urlconf
+from django.utils.safestring import mark_safe
+
+from admin_anchors.utils import (
+    CappedCount,
+    create_admin_anchor,
+    create_admin_change_anchor,
+    resolve_instance_field_path,
+)
 from tests.project.gaming.models import Player, Profile, Team
 
+other_site = admin.AdminSite(name="other_admin")
+other_site.register(Player)
+
+urlpatterns = [
+    path("other-admin/", other_site.urls),
+    path("moved-admin/", admin.site.urls),
+]
+
 
 @pytest.fixture
 def player():
@@ -48,3 +65,77 @@ def test_create_admin_anchor():
         query={"teams__id": 1},
     )
     assert link == "<a href='/admin/gaming/player/?teams__id=1'>Players</a>"
+
+
+def test_create_admin_anchor_escapes_query_and_label():
+    link = create_admin_anchor(
+        app_label="gaming",
+        model_name="player",
+        label="<b>Players</b>",
+        query={"teams__id": 1, "name": "<&>"},
+    )
+    assert link == (
+        "<a href='/admin/gaming/player/?teams__id=1&amp;name=%3C%26%3E'>"
+        "&lt;b&gt;Players&lt;/b&gt;</a>"
+    )
+
+
+def test_create_admin_anchor_keeps_safe_labels():
+    link = create_admin_anchor(
+        app_label="gaming",
+        model_name="player",
+        label=mark_safe("<b>Players</b>"),
+        query={"pk": 1},
+    )
+    assert link == "<a href='/admin/gaming/player/?pk=1'><b>Players</b></a>"
+
+
+def test_create_admin_anchor_follows_root_urlconf_changes():
+    kwargs = {"app_label": "gaming", "model_name": "player", "label": "Players"}
+    assert create_admin_anchor(**kwargs, query={"pk": 1}).startswith(
+        "<a href='/admin/gaming/player/?"
+    )
+
+    with override_settings(ROOT_URLCONF="tests.test_utils"):
+        assert create_admin_anchor(**kwargs, query={"pk": 1}).startswith(
+            "<a href='/moved-admin/gaming/player/?"
+        )
+
+    assert create_admin_anchor(**kwargs, query={"pk": 1}).startswith(
+        "<a href='/admin/gaming/player/?"
+    )
+
+
+def test_create_admin_anchor_follows_the_active_urlconf():
+    set_urlconf("tests.test_utils")
+    try:
+        link = create_admin_anchor(
+            app_label="gaming",
+            model_name="player",
+            label="Players",
+            query={"pk": 1},
+            site_name="other_admin",
+        )
+    finally:
+        set_urlconf(None)
+
+    assert link == "<a href='/other-admin/gaming/player/?pk=1'>Players</a>"
+
+
+def test_capped_count():
+    assert CappedCount(3, limit=5) == 3
+    assert str(CappedCount(3, limit=5)) == "3"
+    assert not CappedCount(5, limit=5).capped
+    assert CappedCount(8, limit=5) == 6
+    assert CappedCount(8, limit=5).capped
+    assert f"{CappedCount(8, limit=5)} members" == "5+ members"
+
+
+def test_create_admin_change_anchor():
+    link = create_admin_change_anchor(
+        app_label="gaming",
+        model_name="player",
+        label="<Player>",
+        object_id="a/b",
+    )
+    assert link == "<a href='/admin/gaming/player/a_2Fb/change/'>&lt;Player&gt;</a>"